@@ -1,55 +1,93 @@
 #!/usr/bin/env python3
+import importlib.util
+import logging
+import os
 import sys
 
-try:
-    from OCC.Core.STEPControl import STEPControl_Reader
-except ImportError:
-    import logging
 
-    logging.basicConfig(level=logging.ERROR, format="[%(levelname)s] %(message)s")
-    logging.error("pythonocc-core is not installed.")
-    logging.error("Install it using: conda install -c conda-forge pythonocc-core")
-    sys.exit(1)
+def _require_occ():
+    """Check for pythonocc, exiting with install hints if it is missing."""
+    try:
+        found = importlib.util.find_spec("OCC.Core.STEPControl") is not None
+    except ImportError:
+        found = False
+    if not found:
+        logging.error("pythonocc-core is not installed.")
+        logging.error("Install it using: conda install -c conda-forge pythonocc-core")
+        sys.exit(1)
+
 
-from step_viewer.managers.application_manager import ApplicationManager
-from step_viewer.managers.log_manager import logger
+_HELP = "\n".join(
+    [
+        "\n" + "=" * 60,
+        "\nViewer Controls:",
+        "  - Left mouse button: Rotate",
+        "  - Right mouse button: Pan",
+        "  - Mouse wheel: Zoom",
+        "  - 'f': Fit all",
+        "  - 's': Toggle face selection mode",
+        "  - 'l': Select largest external face per part",
+        "  - 'c': Clear all selections",
+        "  - 'd': Toggle duplicate parts visibility",
+        "  - 'p': Toggle planar alignment (lay parts flat)",
+        "  - '1': Cycle selection fill color (in selection mode)",
+        "  - '2': Cycle outline color (in selection mode)",
+        "\nView Presets (Shift + number keys):",
+        "  - Shift+1 (!): Front view",
+        "  - Shift+2 (@): Back view",
+        "  - Shift+3 (#): Right view",
+        "  - Shift+4 ($): Left view",
+        "  - Shift+5 (%): Top view",
+        "  - Shift+6 (^): Bottom view",
+        "  - Shift+7 (&): Isometric view",
+        "\nQuit:",
+        "  - 'q' or ESC",
+    ]
+)
+
+
+def _print_help(logger):
+    """Print viewer controls to console."""
+    logger.info(_HELP)
 
 
 def main():
     """Main entry point."""
+    # One setup for every path, matching the viewer's own logger; the early
+    # exits below run before that logger (and pythonocc) is imported
+    logging.basicConfig(
+        level=logging.INFO, format="[%(levelname)s] %(message)s", stream=sys.stdout
+    )
+
     if len(sys.argv) < 2:
-        logger.error("Usage: python main.py <step_file>")
-        logger.info("\nExample:")
-        logger.info("  python main.py model.step")
-        logger.info("  python main.py model.stp")
+        # Usage errors return before any OCC module is loaded
+        logging.error("Usage: python main.py <step_file>")
+        logging.info("\nExample:")
+        logging.info("  python main.py model.step")
+        logging.info("  python main.py model.stp")
         sys.exit(1)
 
-    """Print viewer controls to console."""
-    logger.info("\n" + "=" * 60)
-    logger.info("\nViewer Controls:")
-    logger.info("  - Left mouse button: Rotate")
-    logger.info("  - Right mouse button: Pan")
-    logger.info("  - Mouse wheel: Zoom")
-    logger.info("  - 'f': Fit all")
-    logger.info("  - 's': Toggle face selection mode")
-    logger.info("  - 'l': Select largest external face per part")
-    logger.info("  - 'c': Clear all selections")
-    logger.info("  - 'd': Toggle duplicate parts visibility")
-    logger.info("  - 'p': Toggle planar alignment (lay parts flat)")
-    logger.info("  - '1': Cycle selection fill color (in selection mode)")
-    logger.info("  - '2': Cycle outline color (in selection mode)")
-    logger.info("\nView Presets (Shift + number keys):")
-    logger.info("  - Shift+1 (!): Front view")
-    logger.info("  - Shift+2 (@): Back view")
-    logger.info("  - Shift+3 (#): Right view")
-    logger.info("  - Shift+4 ($): Left view")
-    logger.info("  - Shift+5 (%): Top view")
-    logger.info("  - Shift+6 (^): Bottom view")
-    logger.info("  - Shift+7 (&): Isometric view")
-    logger.info("\nQuit:")
-    logger.info("  - 'q' or ESC")
-
     step_file = sys.argv[1]
+    if step_file in ("-h", "--help"):
+        # Help is static text, so it never pays for the OCC imports either
+        logging.info("Usage: python main.py <step_file>")
+        _print_help(logging.getLogger())
+        sys.exit(0)
+
+    _require_occ()
+
+    if os.environ.get("STEP_VIEWER_NOGUI"):
+        # Load and report counts only; no Tk window or OpenGL context
+        from step_viewer.loaders import StepLoader
+
+        shape, _, _ = StepLoader.load_file(step_file)
+        sys.exit(0 if shape is not None else 1)
+
+    from step_viewer.managers.application_manager import ApplicationManager
+    from step_viewer.managers.log_manager import logger
+
+    _print_help(logger)
+
     viewer = ApplicationManager(step_file)
     viewer.run()
 
@@ -0,0 +1,37 @@
+"""Import the viewer packages in both entry orders (scratchpad).
+
+main.py imports step_viewer.managers first for the GUI and
+step_viewer.loaders first for STEP_VIEWER_NOGUI. Each order runs in a
+fresh interpreter so an import cycle cannot hide behind modules an
+earlier import already loaded.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ORDERS = [
+    ("step_viewer.loaders", "step_viewer.managers"),
+    ("step_viewer.managers", "step_viewer.loaders"),
+]
+
+
+def main():
+    failed = False
+    for order in ORDERS:
+        code = "; ".join(f"import {name}" for name in order)
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True
+        )
+        status = "ok" if result.returncode == 0 else "FAILED"
+        print(f"{' -> '.join(order)}: {status}")
+        if result.returncode != 0:
+            print(result.stderr.strip().splitlines()[-1])
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+"""Warm the Numba on-disk cache for svg_to_polygon's kernels (scratchpad).
+
+Run once after installing Numba so later svg_to_polygon runs load the
+compiled kernels instead of JIT-compiling them.
+"""
+
+import numpy as np
+
+import svg_to_polygon
+
+
+def main():
+    ring = np.array([[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]], dtype=np.float64)
+    ring_offsets = np.array([0, 5, 10], dtype=np.int64)
+    poly_rings = np.array([0, 1, 2], dtype=np.int64)
+    bboxes = np.array([[0, 0, 1, 1], [0, 0, 1, 1]], dtype=np.float64)
+    reps = np.array([[0.5, 0.5], [0.5, 0.5]], dtype=np.float64)
+    svg_to_polygon.containment_matrix(
+        np.vstack([ring, ring]), ring_offsets, poly_rings, bboxes, reps
+    )
+    print("Numba kernels compiled and cached")
+
+
+if __name__ == '__main__':
+    main()
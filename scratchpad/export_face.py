@@ -3,79 +3,138 @@
 Small tester: flattens a face to Z-up and exports an SVG.
 """
 
+import os
 import sys
 import math
+import hashlib
 import argparse
+import functools
 from pathlib import Path
 
+import numpy as np
+
 from OCC.Core.STEPControl import STEPControl_Reader
 from OCC.Core.IFSelect import IFSelect_RetDone
-from OCC.Core.TopExp import TopExp_Explorer
-from OCC.Core.TopAbs import TopAbs_FACE
-from OCC.Core.BRep import BRep_Tool
+from OCC.Core.TopExp import topexp
+from OCC.Core.TopTools import TopTools_IndexedMapOfShape
+from OCC.Core.TopAbs import TopAbs_FACE, TopAbs_EDGE
+from OCC.Core.BRep import BRep_Tool, BRep_Builder
+from OCC.Core.BRepTools import breptools
+from OCC.Core.BRepAdaptor import BRepAdaptor_Curve, BRepAdaptor_Surface
+from OCC.Core.GCPnts import GCPnts_TangentialDeflection
+from OCC.Core.GeomAbs import GeomAbs_Plane
 from OCC.Core.Geom import Geom_Plane
-from OCC.Core.gp import gp_Vec, gp_Pnt, gp_Ax1, gp_Dir, gp_Trsf
-from OCC.Core.TopoDS import TopoDS_Compound, TopoDS_Builder
+from OCC.Core.gp import gp_Pnt, gp_Ax1, gp_Dir, gp_Trsf, gp_Pln
+from OCC.Core.TopoDS import TopoDS_Compound, TopoDS_Builder, TopoDS_Shape, topods
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
 from OCC.Extend.DataExchange import export_shape_to_svg
 
-# Uses OCC.Extend.DataExchange exporter only.
+# Native BREP sidecars of parsed STEP files, keyed by path, mtime and size.
+# The viewer's own sidecars live one level up with a different format, so
+# this tester keeps its entries apart; only the latest one per path is kept
+CACHE_DIR = Path.home() / ".cache" / "steppenface" / "export_face"
+
+
+def _brep_cache_path(path: str) -> Path:
+    resolved = str(Path(path).resolve())
+    st = os.stat(path)
+    path_digest = hashlib.blake2b(resolved.encode("utf8")).hexdigest()[:16]
+    version = f"{st.st_mtime_ns}:{st.st_size}".encode("utf8")
+    version_digest = hashlib.blake2b(version).hexdigest()[:16]
+    return CACHE_DIR / f"{path_digest}-{version_digest}.brep"
+
+
+def _store_brep(shape, cache_path: Path):
+    """Write a BREP sidecar, replacing older entries for the same file."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path_prefix = cache_path.name.split("-")[0]
+    for stale in CACHE_DIR.glob(f"{path_prefix}-*"):
+        stale.unlink(missing_ok=True)
+    # Renamed into place only once complete, so a reader never sees a
+    # truncated BREP
+    tmp = cache_path.with_name(cache_path.name + ".tmp")
+    if not breptools.Write(shape, str(tmp)):
+        raise OSError("breptools.Write failed")
+    os.replace(tmp, cache_path)
 
 
+@functools.lru_cache(maxsize=4)
 def load_step(path: str):
+    """Load a STEP file, reusing a cached BREP of it when one is available."""
+    cache_path = _brep_cache_path(path)
+    if cache_path.exists():
+        shape = TopoDS_Shape()
+        if breptools.Read(shape, str(cache_path), BRep_Builder()):
+            return shape
+
     reader = STEPControl_Reader()
     status = reader.ReadFile(path)
     if status != IFSelect_RetDone:
         raise RuntimeError(f"Failed to read STEP file: {path}")
     reader.TransferRoots()
     shape = reader.OneShape()
+
+    # Cache is best-effort; a failed write only costs a re-parse next time
+    try:
+        _store_brep(shape, cache_path)
+    except Exception as e:
+        print(f"Could not cache BREP for '{path}': {e}", file=sys.stderr)
     return shape
 
 
 def faces_from_shape(shape):
-    exp = TopExp_Explorer(shape, TopAbs_FACE)
-    faces = []
-    while exp.More():
-        faces.append(exp.Current())
-        exp.Next()
-    return faces
+    # One C++ traversal; the indexed map also drops faces shared between shells
+    face_map = TopTools_IndexedMapOfShape()
+    topexp.MapShapes(shape, TopAbs_FACE, face_map)
+    return [face_map.FindKey(i) for i in range(1, face_map.Extent() + 1)]
+
+
+# Plane accessors differ between pythonocc releases; resolve them once here
+# instead of probing with hasattr on every face.
+_downcast_plane = Geom_Plane.DownCast
+
+if hasattr(Geom_Plane, "Plane"):
+    _plane_getter = Geom_Plane.Plane
+else:
+    _plane_getter = Geom_Plane.Pln
+
+if all(hasattr(gp_Pln, name) for name in ("Location", "XDirection", "YDirection")):
+    def _plane_basis(pl):
+        return pl.Location(), pl.XDirection(), pl.YDirection()
+else:
+    def _plane_basis(pl):
+        pos = pl.Position()
+        return pos.Location(), pos.XDirection(), pos.YDirection()
+
+
+def _vec(v):
+    """gp_Vec/gp_Dir/gp_XYZ -> float64[3]."""
+    return np.array([v.X(), v.Y(), v.Z()])
+
+
+def _norm(a):
+    n = np.linalg.norm(a)
+    return a / n if n > 1e-12 else a
 
 
 def find_face_plane_and_basis(face):
-    """Return (origin, ex, ey) for the face plane or an approximate basis."""
+    """Return (origin, ex, ey) for the face plane or an approximate basis.
+
+    `origin` is a gp_Pnt; `ex` and `ey` are float64[3] arrays.
+    """
     surf = BRep_Tool.Surface(face)
     try:
-        plane = Geom_Plane.DownCast(surf)
+        plane = _downcast_plane(surf)
     except Exception:
         plane = None
 
     if plane is not None:
-        pl = None
-        if hasattr(plane, "Plane"):
-            try:
-                pl = plane.Plane()
-            except Exception:
-                pl = None
-        if pl is None and hasattr(plane, "Pln"):
-            try:
-                pl = plane.Pln()
-            except Exception:
-                pl = None
-
-        if pl is not None:
-            if hasattr(pl, "Location") and hasattr(pl, "XDirection") and hasattr(pl, "YDirection"):
-                origin = pl.Location()
-                xdir = pl.XDirection()
-                ydir = pl.YDirection()
-            elif hasattr(pl, "Position"):
-                pos = pl.Position()
-                origin = pos.Location()
-                xdir = pos.XDirection()
-                ydir = pos.YDirection()
-            else:
-                origin = None
-            if origin is not None:
-                return origin, gp_Vec(xdir.X(), xdir.Y(), xdir.Z()), gp_Vec(ydir.X(), ydir.Y(), ydir.Z())
+        try:
+            origin, xdir, ydir = _plane_basis(_plane_getter(plane))
+        except Exception:
+            origin = None
+        if origin is not None:
+            return origin, _vec(xdir), _vec(ydir)
 
     try:
         u1, u2, v1, v2 = BRep_Tool.UVBounds(face)
@@ -87,29 +146,71 @@ def find_face_plane_and_basis(face):
     try:
         P, d1u, d1v = surf.D1(um, vm)
     except Exception:
-        return gp_Pnt(0, 0, 0), gp_Vec(1, 0, 0), gp_Vec(0, 1, 0)
+        return gp_Pnt(0, 0, 0), np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0])
 
-    vu = gp_Vec(d1u.X(), d1u.Y(), d1u.Z())
-    vv = gp_Vec(d1v.X(), d1v.Y(), d1v.Z())
-    vn = vu.Crossed(vv)
-    try:
-        vu.Normalize()
-    except Exception:
-        pass
-    try:
-        vn.Normalize()
-    except Exception:
-        pass
-    ex = vu
-    ey = vn.Crossed(ex)
-    try:
-        ey.Normalize()
-    except Exception:
-        pass
+    vu = _vec(d1u)
+    vn = _norm(np.cross(vu, _vec(d1v)))
+    ex = _norm(vu)
+    ey = _norm(np.cross(vn, ex))
     return P, ex, ey
 
 
-# Uses OCC.Extend.DataExchange exporter only.
+def _fmt(v: float) -> str:
+    s = f"{v:.2f}".rstrip("0").rstrip(".")
+    return "0" if s == "-0" else s
+
+
+def export_flat_face_to_svg(shape, out_path: Path):
+    """Write the top-down projection of a flat `shape`'s edges as SVG polylines.
+
+    Every edge of a planar face is visible when looking along its normal, so
+    the projection is just (x, -y) per sampled point and no HLR pass is needed.
+    """
+    edge_map = TopTools_IndexedMapOfShape()
+    topexp.MapShapes(shape, TopAbs_EDGE, edge_map)
+
+    polylines = []
+    xmin = ymin = math.inf
+    xmax = ymax = -math.inf
+    for i in range(1, edge_map.Extent() + 1):
+        curve = BRepAdaptor_Curve(topods.Edge(edge_map.FindKey(i)))
+        sampler = GCPnts_TangentialDeflection(curve, 0.1, 0.01)
+        points = []
+        for j in range(1, sampler.NbPoints() + 1):
+            p = sampler.Value(j)
+            x, y = p.X(), -p.Y()  # flip Y for the SVG coordinate system
+            xmin, xmax = min(xmin, x), max(xmax, x)
+            ymin, ymax = min(ymin, y), max(ymax, y)
+            points.append(f"{_fmt(x)},{_fmt(y)}")
+        if len(points) >= 2:
+            polylines.append(" ".join(points))
+
+    if not polylines:
+        raise RuntimeError("Face has no edges to export")
+
+    width, height = xmax - xmin, ymax - ymin
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(
+            '<svg xmlns="http://www.w3.org/2000/svg" '
+            f'width="{_fmt(width)}mm" height="{_fmt(height)}mm" '
+            f'viewBox="{_fmt(xmin)} {_fmt(ymin)} {_fmt(width)} {_fmt(height)}">\n'
+        )
+        for points in polylines:
+            f.write(
+                f'<polyline points="{points}" fill="none" '
+                'stroke="black" stroke-width="0.1"/>\n'
+            )
+        f.write("</svg>\n")
+    return out_path
+
+
+def _export_top_down(comp, out_path: Path, planar: bool):
+    if planar:
+        export_flat_face_to_svg(comp, out_path)
+    else:
+        # Curved faces need HLR to resolve silhouettes and hidden edges
+        export_shape_to_svg(comp, str(out_path), direction=gp_Dir(0, 0, 1))
+    return out_path
 
 
 def export_face_with_extend(face, out_path: Path, orthogonalize: bool = True):
@@ -123,33 +224,33 @@ def export_face_with_extend(face, out_path: Path, orthogonalize: bool = True):
     if orthogonalize:
         # Rotate the face so it lies flat in XY plane for sheet cutting
         origin, ex, ey = find_face_plane_and_basis(face)
-        normal = ex.Crossed(ey)
-        normal.Normalize()
-        
-        # Check if normal is already aligned with Z (face is horizontal)
-        z_up = gp_Vec(0, 0, 1)
-        dot_up = abs(normal.Dot(z_up))
-        
-        if dot_up < 0.9:
-            # Face is vertical or angled - rotate to make it horizontal
-            axis = normal.Crossed(z_up)
-            if axis.Magnitude() > 1e-6:
-                axis.Normalize()
-                angle = math.acos(max(-1.0, min(1.0, normal.Dot(z_up))))
-                
-                trsf = gp_Trsf()
-                trsf.SetRotation(
-                    gp_Ax1(origin, gp_Dir(axis.X(), axis.Y(), axis.Z())),
-                    angle
-                )
-                transformer = BRepBuilderAPI_Transform(comp, trsf, True)
-                comp = transformer.Shape()
+        normal = _norm(np.cross(ex, ey))
+        planar = BRepAdaptor_Surface(face).GetType() == GeomAbs_Plane
+
+        # Faces already facing +Z are exported as-is, with no transform;
+        # dot products against +Z reduce to the normal's Z component
+        if abs(normal[2]) >= 0.9:
+            return _export_top_down(comp, out_path, planar)
+
+        # Face is vertical or angled - rotate to make it horizontal
+        axis = np.cross(normal, (0.0, 0.0, 1.0))
+        if np.linalg.norm(axis) > 1e-6:
+            axis = _norm(axis)
+            angle = math.acos(max(-1.0, min(1.0, normal[2])))
+
+            trsf = gp_Trsf()
+            trsf.SetRotation(
+                gp_Ax1(origin, gp_Dir(*map(float, axis))),
+                angle
+            )
+            # A rigid rotation only needs a new location, not a geometry copy
+            transformer = BRepBuilderAPI_Transform(comp, trsf, False)
+            comp = transformer.Shape()
 
     # Force top-down for sheet export
     if orthogonalize:
-        export_shape_to_svg(comp, str(out_path), direction=gp_Dir(0, 0, 1))
-    else:
-        export_shape_to_svg(comp, str(out_path))
+        return _export_top_down(comp, out_path, planar)
+    export_shape_to_svg(comp, str(out_path))
     return out_path
 
 
@@ -162,6 +263,7 @@ def main():
     p.add_argument("--face", required=False, type=int, default=1, help="Face number (1-based)")
     p.add_argument("--out", required=False, default="face_export.svg", help="Output SVG filename")
     p.add_argument("--no-ortho", action="store_true", help="Do not orthogonalize before export")
+    p.add_argument("--all", action="store_true", help="Export every face as <out>_<n>.svg from one STEP load")
     args = p.parse_args()
 
     step_path = Path(args.step)
@@ -173,13 +275,22 @@ def main():
     if not faces:
         raise SystemExit("No faces found in STEP file.")
 
+    out = Path(args.out)
+
+    if args.all:
+        # One STEP parse and OCC startup amortized across every face
+        for n, face in enumerate(faces, start=1):
+            face_out = out.with_name(f"{out.stem}_{n}{out.suffix}")
+            res = export_face_with_extend(face, face_out, orthogonalize=not args.no_ortho)
+            print(f"Wrote SVG to: {res}")
+        return
+
     # CLI uses 1-based face numbering for simplicity
     idx = args.face - 1
     if idx < 0 or idx >= len(faces):
         raise SystemExit(f"Face index out of range. Found {len(faces)} faces. Requested: {args.face}")
 
     selected_face = faces[idx]
-    out = Path(args.out)
 
     # Export: minimal error handling to keep script simple
     res = export_face_with_extend(selected_face, out, orthogonalize=not args.no_ortho)
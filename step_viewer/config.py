@@ -7,6 +7,19 @@ class ViewerConfig:
     BACKGROUND_COLOR = (17 / 255.0, 18 / 255.0, 22 / 255.0)
     MSAA_SAMPLES = 4  # Anti-aliasing quality
 
+    # STEP translation / shape healing, as Interface_Static name -> value
+    # (int -> SetIVal, float -> SetRVal, str -> SetCVal). A fixed user
+    # precision skips most healing passes; files with dirty geometry may read
+    # better with read.precision.mode 0 (the precision stored in the file)
+    STEP_READER_PARAMS = {
+        "read.precision.mode": 1,  # 1 = use read.precision.val
+        "read.precision.val": 0.01,  # mm
+        "read.stdsameparameter.mode": 0,
+        "read.surfacecurve.mode": 3,
+        "read.step.nonmanifold": 0,
+        "read.step.assembly.level": 1,
+    }
+
     # Color scheme
     DARK_BG = "#111216"
     PANEL_BG = "#1a1b1f"
@@ -39,8 +52,8 @@ class ViewerConfig:
     DEFAULT_PLATE_MARGIN_MM = 2.0  # Default margin from plate edges and exclusion zones
     DEFAULT_ALLOW_ROTATION = True  # Allow 90-degree rotation by default
 
-    # Color presets
-    SELECTION_COLOR_PRESETS = [
+    # Color presets (tuples: fixed, and usable as cache keys)
+    SELECTION_COLOR_PRESETS = (
         ((1.0, 0.5, 0.0), "Orange"),
         ((1.0, 0.0, 0.0), "Red"),
         ((0.0, 1.0, 0.0), "Green"),
@@ -48,18 +61,18 @@ class ViewerConfig:
         ((1.0, 0.0, 1.0), "Magenta"),
         ((0.0, 1.0, 1.0), "Cyan"),
         ((1.0, 1.0, 0.0), "Yellow"),
-    ]
+    )
 
-    OUTLINE_COLOR_PRESETS = [
+    OUTLINE_COLOR_PRESETS = (
         ((0.07, 0.07, 0.09), "Dark Gray"),
         ((0.0, 0.0, 0.0), "Black"),
         ((1.0, 1.0, 1.0), "White"),
         ((1.0, 1.0, 0.0), "Yellow"),
         ((0.0, 1.0, 1.0), "Cyan"),
-    ]
+    )
 
     # Part colors (colorblind-friendly palette)
-    PART_PALETTE = [
+    PART_PALETTE = (
         (0.90, 0.40, 0.60),  # Rose/Pink
         (0.40, 0.50, 0.90),  # Bright blue
         (1.00, 0.60, 0.20),  # Orange
@@ -72,4 +85,4 @@ class ViewerConfig:
         (0.80, 0.60, 0.90),  # Lavender
         (0.60, 0.90, 0.70),  # Mint
         (0.90, 0.75, 0.45),  # Tan/Beige
-    ]
+    )
@@ -126,7 +126,7 @@ class ExclusionZoneController:
             if self.planar_alignment_manager.is_aligned:
                 for zone in plate.exclusion_zones:
                     if zone.ais_shape is not None:
-                        self.display.Context.Erase(zone.ais_shape, False)
+                        self.display.Context.Remove(zone.ais_shape, False)
                         zone.ais_shape = None
                 self.display.Context.UpdateCurrentViewer()
 
@@ -246,8 +246,8 @@ class ExclusionZoneController:
         if not self.exclusion_start_point:
             return
 
-        # Clear old preview
-        self.clear_exclusion_preview()
+        # Clear old preview; the viewer is updated once the new one is shown
+        self.clear_exclusion_preview(update=False)
 
         start_x, start_y = self.exclusion_start_point
 
@@ -289,12 +289,20 @@ class ExclusionZoneController:
         self.display.Context.Display(self.exclusion_preview_shape, False)
         self.display.Context.UpdateCurrentViewer()
 
-    def clear_exclusion_preview(self):
-        """Clear the preview rectangle if it exists."""
+    def clear_exclusion_preview(self, update: bool = True):
+        """
+        Clear the preview rectangle if it exists.
+
+        Args:
+            update: Whether to update the viewer after removing the preview
+        """
         if self.exclusion_preview_shape is not None:
             try:
-                self.display.Context.Erase(self.exclusion_preview_shape, False)
-                self.display.Context.UpdateCurrentViewer()
+                # Removed rather than erased: a new preview object is built for
+                # every drag step, so erased ones would pile up in the context
+                self.display.Context.Remove(self.exclusion_preview_shape, False)
+                if update:
+                    self.display.Context.UpdateCurrentViewer()
             except:
                 pass  # Ignore errors if shape was already cleared
             self.exclusion_preview_shape = None
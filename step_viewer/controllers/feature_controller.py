@@ -67,12 +67,12 @@ class FeatureController:
                 self.hidden_selections = {}
 
             # Update parts tree to remove hidden indicators
+            # and restore highlight indicators once every row is back
             self.ui.update_parts_tree(
-                self.part_manager.get_parts(), self.deduplication_manager
+                self.part_manager.get_parts(),
+                self.deduplication_manager,
+                self.tree_controller.restore_tree_highlight_indicators,
             )
-
-            # Restore highlight indicators in the refreshed tree
-            self.tree_controller.restore_tree_highlight_indicators()
         else:
             # Hide duplicate parts
             unique_parts, duplicate_groups = (
@@ -104,13 +104,13 @@ class FeatureController:
             logger.info("Showing only unique parts (duplicates hidden)")
 
             # Update parts tree to show hidden status
+            # and restore highlight indicators once every row is back
             self.ui.update_parts_tree(
-                self.part_manager.get_parts(), self.deduplication_manager
+                self.part_manager.get_parts(),
+                self.deduplication_manager,
+                self.tree_controller.restore_tree_highlight_indicators,
             )
 
-            # Restore highlight indicators in the refreshed tree
-            self.tree_controller.restore_tree_highlight_indicators()
-
         # Re-apply explosion if active
         if self.explode_manager.get_explosion_factor() > 0:
             # Get visible parts for explosion
@@ -127,8 +127,6 @@ class FeatureController:
 
         # Update display
         self.display.Context.UpdateCurrentViewer()
-        self.display.Repaint()
-        self.root.update_idletasks()
 
     def toggle_planar_alignment(self):
         """Toggle planar alignment to lay parts flat."""
@@ -139,10 +137,6 @@ class FeatureController:
                 self.explode_manager.set_explosion_factor(0.0, self.display, self.root)
                 self.ui.explode_slider.set(0.0)
                 self.ui.explode_label.config(text="Explode: 0.00")
-                # Force display update before applying planar alignment
-                self.display.Context.UpdateCurrentViewer()
-                self.display.Repaint()
-                self.root.update_idletasks()
             # Disable explode slider when planar alignment is active
             self.ui.explode_slider.config(state="disabled")
         else:
@@ -65,8 +65,7 @@ class KeyboardController:
             logger.info(f"    Outline width: {self.config.SELECTION_OUTLINE_WIDTH}px\n")
 
             self.root.configure(bg=self.config.SELECTION_MODE_BG)
-            if self.mode_label:
-                self.mode_label.config(text="Mode: Selection", fg="#00ff00")
+            self.mode_label.config(text="Mode: Selection", fg="#00ff00")
         else:
             logger.info("\n*** NAVIGATION MODE ***")
             logger.info("  - Left click: Rotate")
@@ -75,8 +74,7 @@ class KeyboardController:
             logger.info("  - 's': Enter selection mode")
 
             self.root.configure(bg=self.config.DARK_BG)
-            if self.mode_label:
-                self.mode_label.config(text="Mode: Navigation", fg="#00e0ff")
+            self.mode_label.config(text="Mode: Navigation", fg="#00e0ff")
 
     def on_key_c(self, event):
         """Clear all selections."""
@@ -90,7 +88,7 @@ class KeyboardController:
     def on_key_2(self, event):
         """Cycle outline color."""
         self.color_manager.cycle_outline_color()
-        self.selection_manager.update_all_colors(self.root)
+        self.selection_manager.update_outline_color(self.root)
 
     # View preset shortcuts (Shift + number keys)
     def on_key_shift_1(self, event):
@@ -2,39 +2,52 @@
 Material rendering for CAD shapes.
 """
 
-from typing import Optional
 from OCC.Core.Quantity import Quantity_Color, Quantity_TOC_RGB
 from OCC.Core.Graphic3d import Graphic3d_MaterialAspect, Graphic3d_NameOfMaterial
+from OCC.Core.Aspect import Aspect_TOL_SOLID
+from OCC.Core.Prs3d import Prs3d_LineAspect
 
 
 class MaterialRenderer:
     """Handles material application to CAD shapes."""
 
+    # Shared colors. Materials come from matte_material, one per color
+    _specular_color = Quantity_Color(0.05, 0.05, 0.05, Quantity_TOC_RGB)
+    _edge_color = Quantity_Color(0.15, 0.15, 0.15, Quantity_TOC_RGB)
+    # Default face boundary style, shared by every drawer that uses it
+    _edge_aspect = Prs3d_LineAspect(_edge_color, Aspect_TOL_SOLID, 1.0)
+
     @staticmethod
-    def apply_matte_material(
-        ais_shape, color: Quantity_Color, edge_color: Optional[Quantity_Color] = None
-    ):
+    def matte_material(color: Quantity_Color) -> Graphic3d_MaterialAspect:
         """
-        Apply a matte plastic material with edge coloring.
+        Build a matte plastic material in the given color.
 
         Args:
-            ais_shape: The AIS shape object
-            color: Quantity_Color for the shape
-            edge_color: Optional edge color (defaults to dark gray)
+            color: Quantity_Color for the material
+
+        Returns:
+            A new material aspect, reusable across any number of shapes
         """
         material = Graphic3d_MaterialAspect(
             Graphic3d_NameOfMaterial.Graphic3d_NOM_PLASTIC
         )
+        material.SetSpecularColor(MaterialRenderer._specular_color)
         material.SetAmbientColor(color)
         material.SetDiffuseColor(color)
-        dark_color = Quantity_Color(0.05, 0.05, 0.05, Quantity_TOC_RGB)
-        material.SetSpecularColor(dark_color)
-        ais_shape.SetMaterial(material)
+        return material
 
-        if edge_color is None:
-            edge_color = Quantity_Color(0.15, 0.15, 0.15, Quantity_TOC_RGB)
+    @staticmethod
+    def apply_matte_material(ais_shape, material: Graphic3d_MaterialAspect):
+        """
+        Apply a matte plastic material with edge coloring.
+
+        Args:
+            ais_shape: The AIS shape object
+            material: Material built by matte_material; SetMaterial copies it,
+                so shapes in the same color can share one
+        """
+        ais_shape.SetMaterial(material)
 
         drawer = ais_shape.Attributes()
         drawer.SetFaceBoundaryDraw(True)
-        drawer.FaceBoundaryAspect().SetColor(edge_color)
-        drawer.FaceBoundaryAspect().SetWidth(1.0)
+        drawer.SetFaceBoundaryAspect(MaterialRenderer._edge_aspect)
@@ -5,6 +5,9 @@ from ..managers.part_manager import PartManager
 class MouseController:
     """Handles main application mouse events for navigation and face selection."""
 
+    # Drag and wheel input is coalesced into at most one redraw per frame (~60 Hz)
+    FRAME_MS = 16
+
     def __init__(
         self,
         view,
@@ -21,22 +24,43 @@ class MouseController:
         self.start_x = 0
         self.start_y = 0
         self.button = None
+        # Whether the current left drag rotates; decided once on press
+        self.rotating = False
+
+        # Bound SWIG methods resolved once for the per-event paths
+        self._start_rotation = view.StartRotation
+        self._rotation = view.Rotation
+        self._pan = view.Pan
+        # display.ZoomFactor is a wrapper around the same call
+        self._zoom = view.SetZoom
+        self._set_immediate_update = view.SetImmediateUpdate
+        # Navigation only moves the camera, so a view redraw is enough; the
+        # AIS context has nothing new to update
+        self._redraw = view.Redraw
+
+        # Latest drag and wheel input not yet rendered
+        self._render_pending = False
+        self._pending_rotation = None
+        self._pending_pan = [0, 0]
+        self._pending_zoom = 1.0
 
     def on_left_press(self, event):
         """Handle left mouse button press."""
         self.start_x = event.x
         self.start_y = event.y
         self.button = 1
+        self.rotating = not self.selection_manager.is_selection_mode
 
-        if not self.selection_manager.is_selection_mode:
-            self.view.StartRotation(event.x, event.y)
+        if self.rotating:
+            self._start_rotation(event.x, event.y)
 
     def on_left_motion(self, event):
         """Handle left mouse button drag."""
-        if self.button == 1 and not self.selection_manager.is_selection_mode:
-            self.view.Rotation(event.x, event.y)
-            self.display.Context.UpdateCurrentViewer()
-            self.root.update_idletasks()
+        if self.rotating:
+            # Rotation is absolute from StartRotation, so only the latest
+            # position matters
+            self._pending_rotation = (event.x, event.y)
+            self._schedule_render()
 
     def on_right_press(self, event):
         """Handle right mouse button press."""
@@ -47,13 +71,39 @@ class MouseController:
     def on_right_motion(self, event):
         """Handle right mouse button drag."""
         if self.button == 3:
-            dx = event.x - self.start_x
-            dy = self.start_y - event.y
-            self.view.Pan(dx, dy)
-            self.display.Context.UpdateCurrentViewer()
-            self.root.update_idletasks()
+            # Pan is relative, so deltas accumulate until the next frame
+            self._pending_pan[0] += event.x - self.start_x
+            self._pending_pan[1] += self.start_y - event.y
             self.start_x = event.x
             self.start_y = event.y
+            self._schedule_render()
+
+    def _schedule_render(self):
+        """Schedule one redraw for the next frame unless one is pending."""
+        if not self._render_pending:
+            self._render_pending = True
+            self.root.after(self.FRAME_MS, self._render)
+
+    def _render(self):
+        """Apply the drag and wheel input gathered since the last frame and redraw."""
+        self._render_pending = False
+        # Rotation, Pan and SetZoom each redraw the view on their own while
+        # immediate update is on; hold that off so the frame redraws once
+        immediate_update = self._set_immediate_update(False)
+        try:
+            if self._pending_rotation is not None:
+                self._rotation(*self._pending_rotation)
+                self._pending_rotation = None
+            dx, dy = self._pending_pan
+            if dx or dy:
+                self._pan(dx, dy)
+                self._pending_pan[0] = self._pending_pan[1] = 0
+            if self._pending_zoom != 1.0:
+                self._zoom(self._pending_zoom)
+                self._pending_zoom = 1.0
+        finally:
+            self._set_immediate_update(immediate_update)
+        self._redraw()
 
     def on_release(self, event):
         """Handle mouse button release."""
@@ -81,10 +131,15 @@ class MouseController:
                     pass
 
         self.button = None
+        self.rotating = False
 
     def on_wheel(self, event):
         """Handle mouse wheel zoom."""
+        # Wheel ticks compound into one zoom applied on the next frame
         if event.delta > 0 or event.num == 4:
-            self.display.ZoomFactor(1.1)
+            self._pending_zoom *= 1.1
         elif event.delta < 0 or event.num == 5:
-            self.display.ZoomFactor(0.9)
+            self._pending_zoom *= 0.9
+        else:
+            return
+        self._schedule_render()
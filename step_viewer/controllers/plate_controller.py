@@ -125,11 +125,11 @@ class PlateController:
             if self.planar_alignment_manager.is_aligned:
                 for zone in plate.exclusion_zones:
                     if zone.ais_shape is not None:
-                        self.display.Context.Erase(zone.ais_shape, False)
+                        self.display.Context.Remove(zone.ais_shape, False)
 
-                # Erase the plate itself from display
+                # Remove the plate itself from display
                 if plate.ais_shape is not None:
-                    self.display.Context.Erase(plate.ais_shape, False)
+                    self.display.Context.Remove(plate.ais_shape, False)
 
             if self.plate_manager.remove_plate(plate.id):
                 logger.info(f"Deleted plate: {plate.name}")
@@ -13,6 +13,9 @@ from ..managers.part_manager import PartManager
 class TreeController:
     """Manages tree-based part selection and highlighting."""
 
+    # Bright yellow applied to highlighted parts
+    HIGHLIGHT_COLOR = Quantity_Color(1.0, 1.0, 0.0, Quantity_TOC_RGB)
+
     def __init__(
         self,
         ui,
@@ -85,13 +88,11 @@ class TreeController:
             part.pallete[0], part.pallete[1], part.pallete[2], Quantity_TOC_RGB
         )
 
-        # Create bright highlight color (yellow)
-        highlight_color = Quantity_Color(1.0, 1.0, 0.0, Quantity_TOC_RGB)
-
         # Apply highlight
-        self.display.Context.SetColor(part.ais_colored_shape, highlight_color, False)
+        self.display.Context.SetColor(
+            part.ais_colored_shape, self.HIGHLIGHT_COLOR, False
+        )
         self.display.Context.UpdateCurrentViewer()
-        self.display.Repaint()
 
         # Store for later restoration
         self.highlighted_parts[part_idx] = (part.ais_colored_shape, original_color)
@@ -118,7 +119,6 @@ class TreeController:
         # Restore original color
         self.display.Context.SetColor(ais_shape, original_color, False)
         self.display.Context.UpdateCurrentViewer()
-        self.display.Repaint()
 
         # Remove from tracked highlights
         del self.highlighted_parts[part_idx]
@@ -146,59 +146,45 @@ class TreeController:
             part_idx: Index of the part
             is_highlighted: Whether the part is highlighted
         """
-        # Find the tree item for this part
-        root_items = self.ui.parts_tree.get_children()
-        if not root_items:
+        # Rows are inserted with their part tag as iid, so no scan is needed
+        item = f"part_{part_idx}"
+        if not self.ui.parts_tree.exists(item):
             return
 
-        # Get all part items under the root
-        root_item = root_items[0]
-        part_items = self.ui.parts_tree.get_children(root_item)
-
-        # Find the item with matching part tag
-        for item in part_items:
-            tags = self.ui.parts_tree.item(item, "tags")
-            if tags and tags[0] == f"part_{part_idx}":
-                # Get current item text
-                current_text = self.ui.parts_tree.item(item, "text")
-
-                if is_highlighted:
-                    # Add visual indicator (star) if not already present
-                    if not current_text.startswith("★ "):
-                        new_text = "★ " + current_text
-                        self.ui.parts_tree.item(item, text=new_text)
-                        # Make text bold and bright yellow
-                        self.ui.parts_tree.tag_configure(
+        # Get current item text
+        current_text = self.ui.parts_tree.item(item, "text")
+
+        if is_highlighted:
+            # Add visual indicator (star) if not already present
+            if not current_text.startswith("★ "):
+                new_text = "★ " + current_text
+                # Make text bold and bright yellow
+                self.ui.parts_tree.item(
+                    item,
+                    text=new_text,
+                    tags=(f"part_{part_idx}", self.ui.HIGHLIGHT_TAG),
+                )
+        else:
+            # Remove visual indicator
+            if current_text.startswith("★ "):
+                new_text = current_text[2:]  # Remove "★ "
+                self.ui.parts_tree.item(item, text=new_text)
+                # Restore original color (need to recalculate from parts_list)
+                current_parts = self.part_manager.get_parts()
+                if part_idx < len(current_parts):
+                    part = current_parts[part_idx]
+                    # Check if this part is hidden as duplicate
+                    is_hidden = (
+                        self.deduplication_manager
+                        and self.deduplication_manager.is_part_hidden(part_idx)
+                    )
+                    self.ui.parts_tree.item(
+                        item,
+                        tags=(
                             f"part_{part_idx}",
-                            foreground="#ffff00",
-                            font=("Arial", 9, "bold"),
-                        )
-                else:
-                    # Remove visual indicator
-                    if current_text.startswith("★ "):
-                        new_text = current_text[2:]  # Remove "★ "
-                        self.ui.parts_tree.item(item, text=new_text)
-                        # Restore original color (need to recalculate from parts_list)
-                        current_parts = self.part_manager.get_parts()
-                        if part_idx < len(current_parts):
-                            part = current_parts[part_idx]
-                            r, g, b = part.pallete
-                            hex_color = (
-                                f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
-                            )
-                            # Check if this part is hidden as duplicate
-                            is_hidden = (
-                                self.deduplication_manager
-                                and self.deduplication_manager.is_part_hidden(part_idx)
-                            )
-                            if is_hidden:
-                                hex_color = "#666666"
-                            self.ui.parts_tree.tag_configure(
-                                f"part_{part_idx}",
-                                foreground=hex_color,
-                                font=("Arial", 9),
-                            )
-                break
+                            self.ui.part_color_tag(part.pallete, is_hidden),
+                        ),
+                    )
 
     def restore_tree_highlight_indicators(self):
         """Restore highlight indicators in tree after tree refresh."""
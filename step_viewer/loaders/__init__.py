@@ -2,6 +2,6 @@
 File loaders for CAD formats.
 """
 
-from .step_loader import StepLoader
+from .step_loader import SolidStyle, StepLoader
 
-__all__ = ["StepLoader"]
+__all__ = ["SolidStyle", "StepLoader"]
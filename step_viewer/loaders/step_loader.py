@@ -2,72 +2,310 @@
 STEP file loader.
 """
 
+import os
+import hashlib
+import json
+import logging
 from pathlib import Path
-from typing import List
+from typing import List, NamedTuple, Optional, Tuple
 
-from OCC.Core.STEPControl import STEPControl_Reader
+from OCC.Core.STEPCAFControl import STEPCAFControl_Reader
+from OCC.Core.TDocStd import TDocStd_Document
+from OCC.Core.TDF import TDF_Label, TDF_LabelSequence
+from OCC.Core.XCAFDoc import (
+    XCAFDoc_DocumentTool,
+    XCAFDoc_ColorGen,
+    XCAFDoc_ColorSurf,
+)
+from OCC.Core.Quantity import Quantity_Color
+from OCC.Core.BRep import BRep_Builder
+from OCC.Core.BRepTools import breptools
+from OCC.Core.TopoDS import TopoDS_Compound, TopoDS_Shape
 from OCC.Core.IFSelect import IFSelect_RetDone
-from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.Interface import Interface_Static
+from OCC.Core.TopExp import topexp
+from OCC.Core.TopTools import TopTools_IndexedMapOfShape
 from OCC.Core.TopAbs import TopAbs_SOLID, TopAbs_FACE
 
-from step_viewer.managers.log_manager import logger
+from step_viewer.config import ViewerConfig
+
+# The application logger by name: importing managers.log_manager would load
+# the managers package, which itself imports this module
+logger = logging.getLogger("step_viewer")
+
+# Native BREP sidecars of parsed STEP files, keyed by path, mtime and size;
+# re-reading a BREP is far cheaper than translating the STEP again. Only the
+# latest entry per path is kept
+CACHE_DIR = Path.home() / ".cache" / "steppenface"
+
+
+class SolidStyle(NamedTuple):
+    """Color and name the STEP file assigns to one solid."""
+
+    color: Optional[Tuple[float, float, float]]  # RGB, None if uncolored
+    name: Optional[str]
 
 
 class StepLoader:
     """Loads STEP files and extracts geometry."""
 
     @staticmethod
-    def load_file(filename: str):
+    def _configure_reader():
+        """Limit STEP translation to what the viewer displays."""
+        # Keep product structure so assemblies map to solids
+        Interface_Static.SetIVal("read.step.product.mode", 1)
+        # Skip construction geometry linked by relationships; it is never shown
+        Interface_Static.SetIVal("read.step.constructivegeom.relationship", 0)
+        # SHAPE_REPRESENTATION_RELATIONSHIP stays on: assembly files place
+        # their part geometry through it, so disabling it drops solids
+        Interface_Static.SetCVal("read.step.shape.relationship", "ON")
+
+        # Precision and healing profile, tunable in ViewerConfig
+        for name, value in ViewerConfig.STEP_READER_PARAMS.items():
+            if isinstance(value, str):
+                ok = Interface_Static.SetCVal(name, value)
+            elif isinstance(value, float):
+                ok = Interface_Static.SetRVal(name, value)
+            else:
+                ok = Interface_Static.SetIVal(name, value)
+            if not ok:
+                logger.warning(f"Unknown STEP reader parameter: {name}={value!r}")
+
+    @staticmethod
+    def map_shapes(shape, shape_type) -> TopTools_IndexedMapOfShape:
+        """Map unique sub-shapes of a type in one C++ topology walk."""
+        shape_map = TopTools_IndexedMapOfShape()
+        topexp.MapShapes(shape, shape_type, shape_map)
+        return shape_map
+
+    @staticmethod
+    def extract_shapes(shape, shape_type) -> List:
+        """Extract unique sub-shapes of a type, in traversal order."""
+        shape_map = StepLoader.map_shapes(shape, shape_type)
+        # Size is known up front from Extent(); filling a preallocated list
+        # through a bound FindKey keeps the loop to one SWIG call per shape
+        count = shape_map.Extent()
+        find_key = shape_map.FindKey
+        shapes = [None] * count
+        for i in range(count):
+            shapes[i] = find_key(i + 1)
+        return shapes
+
+    @staticmethod
+    def _file_key(filename: str) -> Optional[Tuple[str, int, int]]:
+        """Cache key for a file's current contents, or None if it cannot be read."""
+        # The only existence check on the load path; its error names the
+        # actual cause (missing, permission denied, ...)
+        try:
+            st = os.stat(filename)
+        except OSError as e:
+            logger.error(f"Cannot open '{filename}': {e.strerror}")
+            return None
+        return (os.path.abspath(filename), st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def read_file(filename: str) -> Optional[STEPCAFControl_Reader]:
         """
-        Load a STEP file and return the shape.
+        Parse a STEP file without translating it into shapes.
 
         Returns:
-            The loaded shape or None if loading failed
+            The reader holding the parsed file, or None if it cannot be read
         """
-        if not Path(filename).exists():
-            logger.error(f"File '{filename}' not found.")
-            return None
-
-        step_reader = STEPControl_Reader()
+        step_reader = STEPCAFControl_Reader()
+        # Set after the reader exists: its constructor registers these statics
+        StepLoader._configure_reader()
+        step_reader.SetColorMode(True)
+        step_reader.SetNameMode(True)
+        step_reader.SetLayerMode(False)
         status = step_reader.ReadFile(filename)
 
         if status != IFSelect_RetDone:
             logger.error(f"Failed to read STEP file '{filename}'")
             return None
+        return step_reader
+
+    @staticmethod
+    def load_file(filename: str) -> Tuple[Optional[object], List, List[SolidStyle]]:
+        """
+        Load a STEP file and return the shape with its solids.
+
+        Args:
+            filename: Path of the STEP file
+
+        Returns:
+            Tuple of (shape, solids, styles); styles holds the file's color
+            and name for each solid, in the same order. shape is None if
+            loading failed
+        """
+        key = StepLoader._file_key(filename)
+        if key is None:
+            return None, [], []
 
-        step_reader.TransferRoots()
-        shape = step_reader.OneShape()
+        loaded = StepLoader._load_cached(key)
+        if loaded is None:
+            reader = StepLoader.read_file(filename)
+            if reader is not None:
+                loaded = StepLoader._transfer(reader, filename)
+            if loaded is None:
+                return None, [], []
+            shape, _, styles = loaded
+            StepLoader._store_cached(key, shape, styles)
+
+        # Solids are collected once, on whichever path produced the shape, so
+        # the display never re-explores it. Faces are not walked here:
+        # PartManager.set_parts enumerates every part's faces anyway and logs
+        # their total
+        shape, solids, styles = loaded
+
+        # Without solids the faces decide whether anything can be shown;
+        # checking here avoids building the whole UI for an empty model
+        if shape.IsNull() or (
+            not solids and StepLoader.map_shapes(shape, TopAbs_FACE).Extent() == 0
+        ):
+            logger.error(f"STEP file '{filename}' contains no geometry to display")
+            return None, [], []
 
         logger.info(f"Successfully loaded: {filename}")
+        logger.info(f"  Solids: {len(solids)}")
 
-        # Report entities
-        explorer_solid = TopExp_Explorer(shape, TopAbs_SOLID)
-        solid_count = sum(
-            1
-            for _ in iter(
-                lambda: explorer_solid.More() and not explorer_solid.Next(), False
-            )
-        )
+        return shape, solids, styles
+
+    @staticmethod
+    def _transfer(
+        step_reader: STEPCAFControl_Reader, filename: str
+    ) -> Optional[Tuple[TopoDS_Shape, List, List[SolidStyle]]]:
+        """
+        Translate a parsed STEP file into an XDE document.
+
+        Colors and names are read in the same pass as the geometry, so parts
+        keep what the file assigns them.
+
+        Returns:
+            Tuple of (shape, solids, styles), or None if the transfer fails
+        """
+        doc = TDocStd_Document("MDTV-XCAF")
+        if not step_reader.Transfer(doc):
+            logger.error(f"Failed to transfer STEP file '{filename}'")
+            return None
+
+        shape_tool = XCAFDoc_DocumentTool.ShapeTool(doc.Main())
+        color_tool = XCAFDoc_DocumentTool.ColorTool(doc.Main())
 
-        explorer_face = TopExp_Explorer(shape, TopAbs_FACE)
-        face_count = sum(
-            1
-            for _ in iter(
-                lambda: explorer_face.More() and not explorer_face.Next(), False
-            )
+        # Same result as STEPControl_Reader.OneShape(): a single free shape
+        # as is, several gathered into one compound
+        free_labels = TDF_LabelSequence()
+        shape_tool.GetFreeShapes(free_labels)
+        if free_labels.Length() == 1:
+            shape = shape_tool.GetShape(free_labels.Value(1))
+        else:
+            shape = TopoDS_Compound()
+            builder = BRep_Builder()
+            builder.MakeCompound(shape)
+            for i in range(1, free_labels.Length() + 1):
+                builder.Add(shape, shape_tool.GetShape(free_labels.Value(i)))
+
+        solids = StepLoader.extract_solids(shape)
+        styles = [
+            StepLoader._solid_style(solid, shape_tool, color_tool) for solid in solids
+        ]
+        return shape, solids, styles
+
+    @staticmethod
+    def _solid_style(solid, shape_tool, color_tool) -> SolidStyle:
+        """Look up the color and name the XDE document holds for a solid."""
+        label = TDF_Label()
+        if not shape_tool.Search(solid, label):
+            return SolidStyle(None, None)
+
+        # Assembly components often carry neither; fall back to the part
+        # definition they instance
+        labels = [label]
+        referred = TDF_Label()
+        if shape_tool.GetReferredShape(label, referred):
+            labels.append(referred)
+
+        color = Quantity_Color()
+        rgb = None
+        for lab in labels:
+            if color_tool.GetColor(lab, XCAFDoc_ColorSurf, color) or (
+                color_tool.GetColor(lab, XCAFDoc_ColorGen, color)
+            ):
+                rgb = (color.Red(), color.Green(), color.Blue())
+                break
+
+        name = next(
+            (lab.GetLabelName() for lab in labels if lab.GetLabelName()), None
         )
+        return SolidStyle(rgb, name)
 
-        logger.info(f"  Solids: {solid_count}")
-        logger.info(f"  Faces: {face_count}")
+    @staticmethod
+    def _sidecar_path(key: Tuple[str, int, int], suffix: str = ".brep") -> Path:
+        # Named <path digest>-<version digest>, so every entry for one file
+        # shares a prefix. Reader parameters change the translated shape, so
+        # they key the version too
+        params = sorted(ViewerConfig.STEP_READER_PARAMS.items())
+        path_digest = hashlib.blake2b(key[0].encode("utf8")).hexdigest()[:16]
+        version = repr((key[1:], params)).encode("utf8")
+        version_digest = hashlib.blake2b(version).hexdigest()[:16]
+        return CACHE_DIR / f"{path_digest}-{version_digest}{suffix}"
+
+    @staticmethod
+    def _load_cached(
+        key: Tuple[str, int, int]
+    ) -> Optional[Tuple[TopoDS_Shape, List, List[SolidStyle]]]:
+        """Return a previously translated shape, its solids and styles from sidecars."""
+        sidecar = StepLoader._sidecar_path(key)
+        styles_sidecar = StepLoader._sidecar_path(key, ".json")
+        # A BREP without its styles is re-translated rather than shown uncolored
+        if sidecar.exists() and styles_sidecar.exists():
+            shape = TopoDS_Shape()
+            if breptools.Read(shape, str(sidecar), BRep_Builder()):
+                try:
+                    styles = [
+                        SolidStyle(tuple(rgb) if rgb else None, name)
+                        for rgb, name in json.loads(styles_sidecar.read_text("utf8"))
+                    ]
+                except (OSError, ValueError, TypeError):
+                    return None
+                # display_model indexes styles by solid; sidecars that no
+                # longer line up are re-translated
+                solids = StepLoader.extract_solids(shape)
+                if len(styles) != len(solids):
+                    return None
+                return shape, solids, styles
+        return None
+
+    @staticmethod
+    def _store_cached(
+        key: Tuple[str, int, int], shape: TopoDS_Shape, styles: List[SolidStyle]
+    ):
+        """Write a freshly translated shape and its styles as sidecars."""
+        sidecar = StepLoader._sidecar_path(key)
+        styles_sidecar = StepLoader._sidecar_path(key, ".json")
+        # Best-effort; a failed write only costs a re-translation next time
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Entries for earlier versions of the file are never read again
+            path_prefix = sidecar.name.split("-")[0]
+            for stale in CACHE_DIR.glob(f"{path_prefix}-*"):
+                stale.unlink(missing_ok=True)
 
-        return shape
+            # Each file is written under a temporary name and renamed into
+            # place. The JSON goes last, so it only exists next to a complete
+            # BREP and marks the entry as usable
+            tmp = sidecar.with_name(sidecar.name + ".tmp")
+            if not breptools.Write(shape, str(tmp)):
+                raise OSError("breptools.Write failed")
+            os.replace(tmp, sidecar)
+            # Styles are index-aligned with the solids, which MapShapes
+            # enumerates in the same order from the re-read BREP
+            tmp = styles_sidecar.with_name(styles_sidecar.name + ".tmp")
+            tmp.write_text(json.dumps(styles), "utf8")
+            os.replace(tmp, styles_sidecar)
+        except Exception as e:
+            logger.warning(f"Could not cache BREP for '{key[0]}': {e}")
 
     @staticmethod
     def extract_solids(shape) -> List:
         """Extract all solids from a shape."""
-        explorer = TopExp_Explorer(shape, TopAbs_SOLID)
-        solids = []
-        while explorer.More():
-            solids.append(explorer.Current())
-            explorer.Next()
-        return solids
+        return StepLoader.extract_shapes(shape, TopAbs_SOLID)
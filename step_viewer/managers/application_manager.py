@@ -1,4 +1,6 @@
 from typing import Optional, Tuple
+import os
+import zlib
 import tkinter as tk
 
 from OCC.Core.gp import gp_Pln, gp_Pnt, gp_Dir, gp_Lin
@@ -40,6 +42,9 @@ class ApplicationManager:
         self.root = tk.Tk()
         self.ui = UIManager(self.root, self.config)
         self.shape = None
+        self.solids = []
+        # Color and name the file assigns each solid, aligned with solids
+        self.styles = []
         self.display = None
         self.display_manager = None
         self.tree_controller = None
@@ -54,13 +59,36 @@ class ApplicationManager:
 
     def run(self):
         """Main entry point to run the viewer."""
-        # Load STEP file
-        self.shape = StepLoader.load_file(self.filename)
+        self.ui.setup_window()
+
+        # Name the file while it loads. The load itself stays on this thread:
+        # nothing shows that pythonocc releases the GIL while OCCT reads, and
+        # a worker holding it would freeze the window all the same
+        loading_label = tk.Label(
+            self.root,
+            text=f"Loading {os.path.basename(self.filename)}...",
+            bg=self.config.DARK_BG,
+            fg="#00e0ff",
+            font=("Arial", 11),
+        )
+        loading_label.pack(expand=True)
+        self.root.update()
+
+        try:
+            self.shape, self.solids, self.styles = StepLoader.load_file(self.filename)
+        except Exception as e:
+            logger.error(f"Failed to load '{self.filename}': {e}")
+            self.shape = None
+        loading_label.destroy()
         if self.shape is None:
+            self.root.destroy()
             return
 
-        # Setup UI
-        self.ui.setup_window()
+        self._build_viewer()
+        self.root.mainloop()
+
+    def _build_viewer(self):
+        """Build the viewer UI and display the loaded model."""
         paned_window, left_panel, right_panel = self.ui.create_layout()
 
         self.root.update_idletasks()
@@ -76,7 +104,13 @@ class ApplicationManager:
 
         # Display the model and migrate parts into the central PartManager
         parts = self.display_manager.display_model(
-            self.shape, self.explode_manager, self.planar_alignment_manager
+            self.shape,
+            self.solids,
+            self.explode_manager,
+            self.planar_alignment_manager,
+            # Stable across runs, unlike hash() on str
+            color_seed=zlib.crc32(os.path.basename(self.filename).encode("utf8")),
+            styles=self.styles,
         )
         self.part_manager.set_parts(parts)
 
@@ -85,21 +119,16 @@ class ApplicationManager:
         self.planar_alignment_manager.initialize_parts()
 
         # Register base colors for all parts in the selection manager
-        from OCC.Core.Quantity import Quantity_Color, Quantity_TOC_RGB
-
+        # reusing the colors they were displayed with
         for part in self.part_manager.get_parts():
-            color = Quantity_Color(
-                part.pallete[0], part.pallete[1], part.pallete[2], Quantity_TOC_RGB
-            )
             self.selection_manager.register_part_base_color(
-                part.ais_colored_shape, color
+                part.ais_colored_shape, self.display_manager.part_color(part.pallete)
             )
 
-        # Configure display settings and populate UI from the PartManager
+        # Configure display settings from the PartManager
         self.display_manager.configure_display(
             self.part_manager.get_parts(), self.color_manager
         )
-        self.ui.populate_parts_tree(self.part_manager.get_parts())
 
         # Setup UI controllers
         self._setup_ui_controllers()
@@ -116,9 +145,18 @@ class ApplicationManager:
         # Setup resize handler
         self.display_manager.setup_resize_handler()
 
-        # Final setup
+        # Final setup. All setup work above runs with updateViewer=False;
+        # final_update flushes once
         self.root.after(150, self.display_manager.final_update)
-        self.root.mainloop()
+        # Fill the parts tree after the first fitted paint so large assemblies
+        # show the model before their tree; update_parts_tree clears first, so
+        # a dedup toggle that lands earlier cannot leave a duplicate tree
+        self.root.after(
+            200,
+            self.ui.update_parts_tree,
+            self.part_manager.get_parts(),
+            self.deduplication_manager,
+        )
 
     def _setup_managers_controllers(self):
         """Setup all core controllers and managers."""
@@ -3,28 +3,56 @@ Display manager for initializing and configuring the 3D display.
 """
 
 import tkinter as tk
-import random
-from typing import List, Tuple, Any
+import functools
+import math
+from typing import Any, List, Optional, Sequence, Tuple
 from .part_manager import Part
 
 from OCC.Core.Quantity import Quantity_Color, Quantity_TOC_RGB, Quantity_TOC_sRGB
-from OCC.Core.Aspect import Aspect_GFM_VER, Aspect_TypeOfLine, Aspect_TOTP_RIGHT_LOWER
+from OCC.Core.Aspect import Aspect_GFM_NONE, Aspect_TypeOfLine, Aspect_TOTP_RIGHT_LOWER
 from OCC.Core.AIS import AIS_ColoredShape
 
 from ..config import ViewerConfig
-from ..loaders import StepLoader
 from .log_manager import logger
 
 
+# Palette step between consecutive solids; any step coprime with the palette
+# length visits every color before repeating one
+PALETTE_STRIDE = 7
+
+
+@functools.lru_cache(maxsize=None)
+def _quantity_color(rgb: Tuple[float, float, float]) -> Quantity_Color:
+    """Shared Quantity_Color for an RGB triple; OCCT copies colors it is given."""
+    r, g, b = rgb
+    return Quantity_Color(r, g, b, Quantity_TOC_RGB)
+
+
+@functools.lru_cache(maxsize=None)
+def _palette_colors(palette: Tuple[Tuple[float, float, float], ...]) -> Tuple:
+    """Prebuilt Quantity_Color per palette entry, shared across loads."""
+    return tuple(_quantity_color(rgb) for rgb in palette)
+
+
 class CanvasManager:
     """Manages 3D display initialization, configuration, and model rendering."""
 
+    # Quiet time after the last Configure event before the view is resized
+    RESIZE_DEBOUNCE_MS = 50
+
     def __init__(self, root: tk.Tk, config: ViewerConfig):
         self.root = root
         self.config = config
         self.display = None
         self.canvas = None
-        self.resize_state = {"pending": False, "initialized": False}
+        self.resize_state = {"after_id": None, "initialized": False}
+
+        # Imported here, not at module level: controllers import managers
+        from ..controllers.material_renderer import MaterialRenderer
+
+        # Resolved once rather than re-imported for every displayed solid
+        self._apply_material = MaterialRenderer.apply_matte_material
+        self._matte_material = MaterialRenderer.matte_material
 
     def init_display(self, parent) -> Any:
         """
@@ -55,70 +83,119 @@ class CanvasManager:
         return self.display
 
     def display_model(
-        self, shape, explode_manager, planar_alignment_manager
+        self,
+        shape,
+        solids: List,
+        explode_manager,
+        planar_alignment_manager,
+        color_seed: int = 0,
+        styles: Sequence = (),
     ) -> List[Tuple]:
         """
         Display the loaded model with colored parts using AIS_ColoredShape.
 
         Args:
             shape: The STEP shape to display
+            solids: Solids of the shape, as collected by StepLoader.load_file
             explode_manager: Manager for explosion effects
             planar_alignment_manager: Manager for planar alignment
+            color_seed: Palette offset for the first solid, so a file always
+                gets the same part colors
+            styles: SolidStyle per solid, as read by StepLoader.load_file;
+                solids the file leaves uncolored take palette colors
 
         Returns:
             List of Part namedtuples
         """
-        from ..controllers.material_renderer import MaterialRenderer
-
-        solids = StepLoader.extract_solids(shape)
-        palette = self.config.PART_PALETTE.copy()
+        palette = self.config.PART_PALETTE
+        colors = _palette_colors(palette)
         parts_list: List[Part] = []
 
         if len(solids) == 0:
+            # Single-body files need only the first palette entry's material
             logger.info("No individual solids found, displaying shape as single object")
-            color = Quantity_Color(
-                palette[0][0], palette[0][1], palette[0][2], Quantity_TOC_RGB
-            )
-            # Create AIS_ColoredShape instead of AIS_Shape
-            ais_colored_shape = AIS_ColoredShape(shape)
-            ais_colored_shape.SetColor(color)
-            ais_colored_shape.SetTransparency(0.0)
-            ais_colored_shape.SetDisplayMode(1)
-            self.display.Context.Display(ais_colored_shape, False)
-            MaterialRenderer.apply_matte_material(ais_colored_shape, color)
-            parts_list.append(
-                Part(
-                    shape=shape, pallete=palette[0], ais_colored_shape=ais_colored_shape
-                )
-            )
+            material = self._matte_material(colors[0])
+            parts_list.append(self._display_part(shape, palette[0], colors[0], material))
         else:
-            random.shuffle(palette)
+            # One material per palette color, shared by every solid in that color
+            materials = tuple(self._matte_material(color) for color in colors)
+            # Likewise one material per color taken from the file
+            file_materials = {}
+            n_colors = len(palette)
+            stride = PALETTE_STRIDE if math.gcd(PALETTE_STRIDE, n_colors) == 1 else 1
+            n_styles = len(styles)
             for i, solid in enumerate(solids):
-                r, g, b = palette[i % len(palette)]
-                color = Quantity_Color(r, g, b, Quantity_TOC_RGB)
-                # Create AIS_ColoredShape instead of AIS_Shape
-                ais_colored_shape = AIS_ColoredShape(solid)
-                ais_colored_shape.SetColor(color)
-                ais_colored_shape.SetTransparency(0.0)
-                ais_colored_shape.SetDisplayMode(1)
-                self.display.Context.Display(ais_colored_shape, False)
-                MaterialRenderer.apply_matte_material(ais_colored_shape, color)
-                parts_list.append(
-                    Part(
-                        shape=solid,
-                        pallete=(r, g, b),
-                        ais_colored_shape=ais_colored_shape,
-                    )
-                )
+                style = styles[i] if i < n_styles else None
+                name = style.name if style else None
+                if style and style.color:
+                    rgb = style.color
+                    color = _quantity_color(rgb)
+                    material = file_materials.get(rgb)
+                    if material is None:
+                        material = file_materials[rgb] = self._matte_material(color)
+                else:
+                    slot = (color_seed + i * stride) % n_colors
+                    rgb, color, material = palette[slot], colors[slot], materials[slot]
+                parts_list.append(self._display_part(solid, rgb, color, material, name))
 
             logger.info(f"Assigned colors to {len(solids)} solid(s)")
 
-        self.display.Context.UpdateCurrentViewer()
-        self.display.FitAll()
-        self.display.Repaint()
-
+        # No redraw here: the view is fitted and repainted once in
+        # final_update, after configure_display has set the background
         return parts_list
 
+    def part_color(self, rgb: Tuple[float, float, float]) -> Quantity_Color:
+        """
+        Get the Quantity_Color a part was displayed with.
+
+        Args:
+            rgb: The part's RGB, from the palette or the file
+
+        Returns:
+            The shared Quantity_Color for that RGB
+        """
+        return _quantity_color(tuple(rgb))
+
+    def _display_part(
+        self,
+        shape,
+        rgb: Tuple[float, float, float],
+        color,
+        material,
+        name: Optional[str] = None,
+    ) -> Part:
+        """
+        Display one shape as a colored, matte part.
+
+        Args:
+            shape: Solid (or whole model) to display
+            rgb: RGB the color was built from
+            color: Quantity_Color for the part
+            material: Matte material prebuilt in that color
+            name: Part name from the file, if it has one
+
+        Returns:
+            Part namedtuple for the displayed shape
+        """
+        # Create AIS_ColoredShape instead of AIS_Shape
+        ais_colored_shape = AIS_ColoredShape(shape)
+        ais_colored_shape.SetColor(color)
+        # Parts are opaque by default; the shaded mode is stored on the object
+        # so later re-displays (e.g. unhiding a part) stay shaded
+        ais_colored_shape.SetDisplayMode(1)
+        # Style before displaying so the presentation is computed once
+        # with its final aspects. No default selection mode: face
+        # picking is activated in configure_display, so
+        # building a whole-shape selection for every solid is wasted
+        self._apply_material(ais_colored_shape, material)
+        self.display.Context.Display(ais_colored_shape, 1, -1, False)
+        return Part(
+            shape=shape,
+            pallete=rgb,
+            ais_colored_shape=ais_colored_shape,
+            name=name or "",
+        )
+
     def configure_display(self, parts_list: List[Part], color_manager):
         """
         Configure display settings (background, antialiasing, selection).
@@ -134,8 +211,9 @@ class CanvasManager:
             self.config.BACKGROUND_COLOR[2],
             Quantity_TOC_sRGB,
         )
-        self.display.View.SetBgGradientStyle(Aspect_GFM_VER)
-        self.display.View.SetBgGradientColors(bg_color, bg_color)
+        # The display starts with a gradient; switch it off rather than
+        # painting both gradient stops in the background color
+        self.display.View.SetBgGradientStyle(Aspect_GFM_NONE, False)
         self.display.View.SetBackgroundColor(bg_color)
 
         # Antialiasing
@@ -185,43 +263,49 @@ class CanvasManager:
         except Exception as e:
             logger.warning(f"Could not configure selection style: {e}")
 
-        # Enable face selection for all parts
+        # Enable face selection for all parts in one call; only the parts are
+        # displayed at this point, so this is the same set as a per-part loop
+        self.display.Context.Activate(4, False)  # 4 = TopAbs_FACE
         for part in parts_list:
-            self.display.Context.Activate(
-                part.ais_colored_shape, 4, False
-            )  # 4 = TopAbs_FACE
             part.ais_colored_shape.SetHilightMode(1)
 
     def setup_resize_handler(self):
         """Setup resize event handler with debouncing."""
+        # Closed over by the handlers below, so Configure events never go
+        # through the display's SWIG proxy to reach the view
+        view = self.display.View
+        resize_state = self.resize_state
+        root = self.root
+
+        def do_resize():
+            resize_state["after_id"] = None
+            try:
+                view.MustBeResized()
+                view.Redraw()
+            except Exception as e:
+                logger.warning(f"Could not resize view: {e}")
 
         def on_resize(event):
-            if not self.resize_state["initialized"]:
+            if not resize_state["initialized"]:
                 return
 
-            if not self.resize_state["pending"]:
-                self.resize_state["pending"] = True
-
-                def do_resize():
-                    try:
-                        self.display.View.MustBeResized()
-                        self.display.View.Redraw()
-                    except Exception as e:
-                        logger.warning(f"Could not resize view: {e}")
-                    finally:
-                        self.resize_state["pending"] = False
-
-                self.root.after(10, do_resize)
+            # Restart the timer on every Configure, so a window drag resizes
+            # the view once, at its final size
+            if resize_state["after_id"] is not None:
+                root.after_cancel(resize_state["after_id"])
+            resize_state["after_id"] = root.after(self.RESIZE_DEBOUNCE_MS, do_resize)
 
         self.canvas.bind("<Configure>", on_resize)
 
     def final_update(self):
         """Final update after UI is fully initialized."""
         try:
-            self.display.View.MustBeResized()
-            self.display.Context.UpdateCurrentViewer()
-            self.display.FitAll()
-            self.display.Repaint()
+            # Fit without redrawing, then draw the first frame exactly once
+            view = self.display.View
+            view.MustBeResized()
+            view.ZFitAll()
+            view.FitAll(0.01, False)
+            view.Redraw()
             self.resize_state["initialized"] = True
         except Exception as e:
             logger.warning(f"Could not perform final update: {e}")
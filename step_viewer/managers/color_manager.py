@@ -14,6 +14,16 @@ class ColorManager:
         self.config = config
         self.fill_index = 0
         self.outline_index = 0
+        # One shared Quantity_Color per preset; OCCT copies colors on assignment,
+        # so every highlight can reuse the same instance
+        self._fill_colors = tuple(
+            Quantity_Color(r, g, b, Quantity_TOC_RGB)
+            for (r, g, b), _ in config.SELECTION_COLOR_PRESETS
+        )
+        self._outline_colors = tuple(
+            Quantity_Color(r, g, b, Quantity_TOC_RGB)
+            for (r, g, b), _ in config.OUTLINE_COLOR_PRESETS
+        )
 
     def get_current_fill_color(self) -> Tuple[Tuple[float, float, float], str]:
         """Get current fill color preset."""
@@ -39,10 +49,8 @@ class ColorManager:
 
     def get_fill_quantity_color(self) -> Quantity_Color:
         """Get current fill color as Quantity_Color."""
-        rgb, _ = self.get_current_fill_color()
-        return Quantity_Color(rgb[0], rgb[1], rgb[2], Quantity_TOC_RGB)
+        return self._fill_colors[self.fill_index]
 
     def get_outline_quantity_color(self) -> Quantity_Color:
         """Get current outline color as Quantity_Color."""
-        rgb, _ = self.get_current_outline_color()
-        return Quantity_Color(rgb[0], rgb[1], rgb[2], Quantity_TOC_RGB)
+        return self._outline_colors[self.outline_index]
@@ -5,10 +5,10 @@ Shape deduplication manager for filtering identical parts.
 from typing import List, Tuple, Dict
 from OCC.Core.GProp import GProp_GProps
 from OCC.Core.BRepGProp import brepgprop
-from OCC.Core.TopAbs import TopAbs_FACE, TopAbs_EDGE
-from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopAbs import TopAbs_EDGE
 
 from .log_manager import logger
+from ..loaders import StepLoader
 
 
 class DeduplicationManager:
@@ -17,6 +17,9 @@ class DeduplicationManager:
     def __init__(self):
         self.show_duplicates = True
         self.hidden_indices = set()  # Indices of parts that are hidden as duplicates
+        # Signatures by part shape; geometry never changes after loading, so
+        # each solid is measured and walked once however often 'd' is pressed
+        self._signatures: Dict = {}
 
     def toggle_duplicates(self) -> bool:
         """Toggle whether to show duplicate parts. Returns new state."""
@@ -49,7 +52,11 @@ class DeduplicationManager:
         self.hidden_indices.clear()
 
         for i, part in enumerate(parts_list):
-            signature = self._compute_shape_signature(part.shape)
+            signature = self._signatures.get(part.shape)
+            if signature is None:
+                signature = self._signatures[part.shape] = (
+                    self._compute_shape_signature(part)
+                )
 
             # Check if this signature matches any existing unique part
             match_found = False
@@ -78,9 +85,9 @@ class DeduplicationManager:
 
         return unique_parts, duplicate_groups
 
-    def _compute_shape_signature(self, solid) -> Dict:
+    def _compute_shape_signature(self, part) -> Dict:
         """
-        Compute a signature for a solid based on its geometric properties.
+        Compute a signature for a part's solid based on its geometric properties.
 
         Returns a dictionary with:
         - volume: Volume of the solid
@@ -88,6 +95,8 @@ class DeduplicationManager:
         - face_count: Number of faces
         - edge_count: Number of edges
         """
+        solid = part.shape
+
         # Calculate volume and surface area
         props = GProp_GProps()
         brepgprop.VolumeProperties(solid, props)
@@ -97,18 +106,9 @@ class DeduplicationManager:
         brepgprop.SurfaceProperties(solid, surface_props)
         surface_area = surface_props.Mass()
 
-        # Count faces and edges
-        face_count = 0
-        explorer = TopExp_Explorer(solid, TopAbs_FACE)
-        while explorer.More():
-            face_count += 1
-            explorer.Next()
-
-        edge_count = 0
-        explorer = TopExp_Explorer(solid, TopAbs_EDGE)
-        while explorer.More():
-            edge_count += 1
-            explorer.Next()
+        # Faces were already collected by PartManager; only edges need a walk
+        face_count = len(part.faces)
+        edge_count = StepLoader.map_shapes(solid, TopAbs_EDGE).Extent()
 
         return {
             "volume": volume,
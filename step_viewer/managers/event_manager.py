@@ -54,14 +54,22 @@ class EventManager:
                 except:
                     pass
 
+        # Whether each widget is a Treeview, so the check below costs a dict
+        # lookup per event instead of a winfo_class round-trip to Tcl
+        is_tree_widget = {}
+
         # Helper to stop event propagation (but allow tree widget events)
         def make_handler(func):
             def handler(event):
+                widget = event.widget
+                is_tree = is_tree_widget.get(widget)
+                if is_tree is None:
+                    is_tree = is_tree_widget[widget] = (
+                        hasattr(widget, "winfo_class")
+                        and widget.winfo_class() == "Treeview"
+                    )
                 # Don't intercept events from the parts tree
-                if (
-                    hasattr(event.widget, "winfo_class")
-                    and event.widget.winfo_class() == "Treeview"
-                ):
+                if is_tree:
                     return
                 func(event)
                 return "break"
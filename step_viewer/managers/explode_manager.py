@@ -67,7 +67,7 @@ class ExplodeManager:
         Args:
             factor: Explosion factor (0.0 = normal, higher values = more exploded)
             display: The OCC display object
-            root: Tkinter root for UI updates
+            root: Tkinter root (unused, kept for caller compatibility)
         """
         from .log_manager import logger
 
@@ -132,12 +132,12 @@ class ExplodeManager:
             # Apply transformation
             part.ais_colored_shape.SetLocalTransformation(trsf)
 
-            # Update display
-            display.Context.Redisplay(part.ais_colored_shape, True)
+            # Recompute the presentation; the viewer updates once below
+            display.Context.Redisplay(part.ais_colored_shape, False)
 
-        # Refresh display
+        # Refresh display once per slider step; Tk repaints its own widgets
+        # when idle, so no forced update_idletasks here
         display.Context.UpdateCurrentViewer()
-        root.update_idletasks()
 
     def reset(self, display, root):
         """Reset all parts to original positions."""
@@ -21,6 +21,8 @@ def setup_logger(
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
+    # Has its own handler; propagating to a configured root would print twice
+    logger.propagate = False
 
     # Avoid adding handlers multiple times
     if logger.handlers:
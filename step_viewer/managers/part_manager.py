@@ -5,13 +5,14 @@ Manager for operations of individual parts.
 from typing import NamedTuple, List, Optional, Dict, Set, Tuple
 from .log_manager import logger
 from .units_manager import UnitSystem
+from ..loaders import StepLoader
 
 from OCC.Core.TopoDS import TopoDS_Shape, TopoDS_Face
-from OCC.Core.TopExp import TopExp_Explorer
 from OCC.Core.TopAbs import TopAbs_FACE, TopAbs_WIRE, TopAbs_EDGE
 from OCC.Core.GProp import GProp_GProps
 from OCC.Core.BRepGProp import brepgprop
 from OCC.Core.BRepAdaptor import BRepAdaptor_Surface
+from OCC.Core.GeomAbs import GeomAbs_Plane
 from OCC.Core.gp import gp_Pnt, gp_Vec
 import hashlib
 from OCC.Core.AIS import AIS_ColoredShape
@@ -39,6 +40,7 @@ class Part(NamedTuple):
     pallete: tuple[float, float, float]
     ais_colored_shape: AIS_ColoredShape
     faces: Tuple[Face, ...] = ()  # Tuple of faces in this part
+    name: str = ""  # Name from the STEP file, empty if it has none
 
 
 class PartManager:
@@ -78,26 +80,26 @@ class PartManager:
             faces = []
 
             if part.shape:
-                exp = TopExp_Explorer(part.shape, TopAbs_FACE)
-                while exp.More():
-                    face_shape = exp.Current()
+                for face_shape in StepLoader.extract_shapes(part.shape, TopAbs_FACE):
                     face_props = self._compute_face_properties(face_shape, part_idx, global_face_idx)
                     faces.append(face_props)
 
-                    # Store in lookup maps
-                    face_key = face_shape.__hash__()
+                    # Store in lookup maps. pythonocc hashes TopoDS shapes with
+                    # OCCT's native std::hash (TShape and location), so a face
+                    # re-wrapped by DetectedShape() maps to the same key
+                    face_key = hash(face_shape)
                     self._face_map[face_key] = face_props
                     self._face_by_fingerprint[face_props.fingerprint] = face_props
 
                     global_face_idx += 1
-                    exp.Next()
 
             # Create new Part with faces tuple
             part_with_faces = Part(
                 shape=part.shape,
                 pallete=part.pallete,
                 ais_colored_shape=part.ais_colored_shape,
-                faces=tuple(faces)
+                faces=tuple(faces),
+                name=part.name,
             )
             parts_with_faces.append(part_with_faces)
 
@@ -110,7 +112,7 @@ class PartManager:
         logger.info(f"Total faces: {total_faces}")
 
     def get_face_key(self, face) -> int:
-        return face.__hash__()
+        return hash(face)
 
     def _compute_face_properties(self, face_shape: TopoDS_Face, part_index: int, global_index: int) -> Face:
         """
@@ -131,8 +133,8 @@ class PartManager:
         centroid_pt = props.CentreOfMass()
         centroid = (float(centroid_pt.X()), float(centroid_pt.Y()), float(centroid_pt.Z()))
 
-        # Compute fingerprint
-        fingerprint = self._compute_fingerprint(face_shape)
+        # Compute fingerprint from the same surface integration
+        fingerprint = self._compute_fingerprint(face_shape, area, centroid)
 
         # Compute normal vector at face center
         normal = self._compute_face_normal(face_shape, centroid_pt)
@@ -203,9 +205,6 @@ class PartManager:
         Returns:
             True if the face is planar, False otherwise
         """
-        from OCC.Core.GeomAbs import GeomAbs_Plane
-        from OCC.Core.BRepAdaptor import BRepAdaptor_Surface
-
         adaptor = BRepAdaptor_Surface(face_shape)
         return adaptor.GetType() == GeomAbs_Plane
 
@@ -260,31 +259,26 @@ class PartManager:
         Returns:
             Face namedtuple or None if not found
         """
-        face_key = face_shape.__hash__()
+        face_key = hash(face_shape)
         return self._face_map.get(face_key)
 
-    def _compute_fingerprint(self, face) -> str:
+    def _compute_fingerprint(
+        self, face, area: float, centroid: Tuple[float, float, float]
+    ) -> str:
         """
         Compute stable 64-bit fingerprint from face geometry.
         Derived from: area, centroid coordinates, number of wires and edges.
+
+        Args:
+            face: The TopoDS_Face to fingerprint
+            area: Face area, as already computed for the Face record
+            centroid: Face centroid, as already computed for the Face record
         """
-        props = GProp_GProps()
-        brepgprop.SurfaceProperties(face, props)
-        area = float(props.Mass())
-        c = props.CentreOfMass()
-        cx, cy, cz = float(c.X()), float(c.Y()), float(c.Z())
+        cx, cy, cz = centroid
 
         # count wires and edges
-        wires = 0
-        edges = 0
-        wexp = TopExp_Explorer(face, TopAbs_WIRE)
-        while wexp.More():
-            wires += 1
-            eexp = TopExp_Explorer(wexp.Current(), TopAbs_EDGE)
-            while eexp.More():
-                edges += 1
-                eexp.Next()
-            wexp.Next()
+        wires = StepLoader.map_shapes(face, TopAbs_WIRE).Extent()
+        edges = StepLoader.map_shapes(face, TopAbs_EDGE).Extent()
 
         s = f"area={area:.6f};centroid={cx:.6f},{cy:.6f},{cz:.6f};wires={wires};edges={edges}"
         h = hashlib.sha1(s.encode("utf8")).digest()[:8]
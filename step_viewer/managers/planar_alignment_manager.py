@@ -10,7 +10,6 @@ from OCC.Core.gp import gp_Trsf, gp_Vec, gp_Ax1, gp_Pnt, gp_Dir
 from OCC.Core.GProp import GProp_GProps
 from OCC.Core.BRepGProp import brepgprop
 from OCC.Core.TopAbs import TopAbs_FACE
-from OCC.Core.TopExp import TopExp_Explorer
 from OCC.Core.BRepAdaptor import BRepAdaptor_Surface
 from OCC.Core.GeomAbs import GeomAbs_Plane
 from OCC.Core.Bnd import Bnd_Box
@@ -211,7 +210,7 @@ class PlanarAlignmentManager:
             final_trsf.Multiply(pt["rotation_trsf"])
 
             pt["ais_shape"].SetLocalTransformation(final_trsf)
-            display.Context.Redisplay(pt["ais_shape"], True)
+            display.Context.Redisplay(pt["ais_shape"], False)
 
         # Show plates (if any)
         if self.plate_manager:
@@ -236,7 +235,7 @@ class PlanarAlignmentManager:
                     # Clear transformation
                     ais_shape.SetLocalTransformation(gp_Trsf())
 
-                display.Context.Redisplay(ais_shape, True)
+                display.Context.Redisplay(ais_shape, False)
 
         # Hide plates
         if self.plate_manager:
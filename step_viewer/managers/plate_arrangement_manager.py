@@ -7,7 +7,8 @@ from typing import List, Tuple, Optional
 from dataclasses import dataclass
 import math
 
-from OCC.Core.gp import gp_Trsf, gp_Vec, gp_Pnt
+from OCC.Core.gp import gp_Trsf, gp_Vec, gp_Pnt, gp_Ax1, gp_Dir
+from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
 from OCC.Core.Bnd import Bnd_Box
 from OCC.Core.BRepBndLib import brepbndlib
 from step_viewer.managers.part_manager import Part
@@ -672,8 +673,6 @@ class PlateArrangementManager:
 
         logger.info("Applying arrangement to parts...")
 
-        from OCC.Core.gp import gp_Ax1, gp_Dir
-
         for result in packing_results:
             if result.part_idx >= len(parts_list):
                 continue
@@ -695,8 +694,6 @@ class PlateArrangementManager:
             )
 
             # Get the TRANSFORMED bounding box (shape in current position)
-            from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
-
             transformed_solid = BRepBuilderAPI_Transform(
                 part.shape, current_trsf, False
             ).Shape()
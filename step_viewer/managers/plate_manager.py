@@ -15,7 +15,6 @@ from OCC.Core.AIS import AIS_Shape
 from OCC.Core.Bnd import Bnd_Box
 from OCC.Core.BRepBndLib import brepbndlib
 from OCC.Core.TopoDS import TopoDS_Compound, TopoDS_Builder, topods
-from OCC.Core.TopExp import TopExp_Explorer
 from OCC.Core.TopAbs import TopAbs_FACE
 from OCC.Core.GProp import GProp_GProps
 from OCC.Core.BRepGProp import brepgprop
@@ -25,6 +24,7 @@ from shapely.ops import unary_union, polygonize, linemerge, snap
 import xml.etree.ElementTree as ET
 
 from .log_manager import logger
+from ..loaders import StepLoader
 
 
 @dataclass
@@ -365,6 +365,8 @@ class PlateManager:
         """
         Show all plates and their exclusion zones in the display.
 
+        The viewer is not updated; callers redraw once when done.
+
         Args:
             display: The OCC display context
         """
@@ -373,7 +375,7 @@ class PlateManager:
                 self._create_plate_geometry(plate)
 
             if plate.ais_shape is not None:
-                display.Context.Display(plate.ais_shape, True)
+                display.Context.Display(plate.ais_shape, False)
 
             # Show exclusion zones for this plate
             self._show_exclusion_zones(plate, display)
@@ -382,12 +384,14 @@ class PlateManager:
         """
         Hide all plates and their exclusion zones from the display.
 
+        The viewer is not updated; callers redraw once when done.
+
         Args:
             display: The OCC display context
         """
         for plate in self.plates:
             if plate.ais_shape is not None:
-                display.Context.Erase(plate.ais_shape, True)
+                display.Context.Erase(plate.ais_shape, False)
 
             # Hide exclusion zones for this plate
             self._hide_exclusion_zones(plate, display)
@@ -412,9 +416,9 @@ class PlateManager:
             display: The OCC display context.
             plate: The Plate object to be updated.
         """
-        # Clear old geometry
+        # Clear old geometry; it is rebuilt below, so remove it from the context
         if plate.ais_shape is not None:
-            display.Context.Erase(plate.ais_shape, False)
+            display.Context.Remove(plate.ais_shape, False)
             plate.ais_shape = None
 
         # Hide old exclusion zones
@@ -522,8 +526,9 @@ class PlateManager:
             display: The OCC display context
         """
         for zone in plate.exclusion_zones:
+            # Zone geometry is rebuilt when shown again, so remove it outright
             if zone.ais_shape is not None:
-                display.Context.Erase(zone.ais_shape, False)
+                display.Context.Remove(zone.ais_shape, False)
                 zone.ais_shape = None
 
     def _create_exclusion_zone_geometry(self, zone: ExclusionZone, plate: Plate):
@@ -685,9 +690,8 @@ class PlateManager:
         best_face = None
         best_z = float('-inf')
 
-        explorer = TopExp_Explorer(part.shape, TopAbs_FACE)
-        while explorer.More():
-            face = topods.Face(explorer.Current())
+        for face_shape in StepLoader.extract_shapes(part.shape, TopAbs_FACE):
+            face = topods.Face(face_shape)
 
             # Get face centroid
             props = GProp_GProps()
@@ -701,8 +705,6 @@ class PlateManager:
                 best_z = centroid.Z()
                 best_face = face
 
-            explorer.Next()
-
         if best_face:
             logger.debug(f"Found top face at Z={best_z:.2f}")
         else:
@@ -5,13 +5,13 @@ Face selection state management using AIS_ColoredShape for highlighting.
 from typing import Dict, List, Tuple
 
 from OCC.Core.AIS import AIS_ColoredShape, AIS_Shape
-from OCC.Core.TopExp import TopExp_Explorer
 from OCC.Core.TopAbs import TopAbs_FACE, TopAbs_WIRE, TopAbs_EDGE
 from OCC.Core.GProp import GProp_GProps
 from OCC.Core.BRepGProp import brepgprop
 from OCC.Core.BRepAdaptor import BRepAdaptor_Surface
 from OCC.Core.gp import gp_Pnt, gp_Vec, gp_Dir, gp_Lin, gp_Ax1
 from OCC.Core.BRepIntCurveSurface import BRepIntCurveSurface_Inter
+from OCC.Core.Quantity import Quantity_Color, Quantity_TOC_RGB
 import hashlib
 
 from ..managers.planar_alignment_manager import PlanarAlignmentManager
@@ -24,6 +24,9 @@ from .log_manager import logger
 class SelectionManager:
     """Manages face selection state and highlighting."""
 
+    # Base color used for parts that never registered one
+    FALLBACK_BASE_COLOR = Quantity_Color(0.5, 0.5, 0.5, Quantity_TOC_RGB)
+
     def __init__(
         self,
         display,
@@ -36,6 +39,8 @@ class SelectionManager:
         self.color_manager = color_manager
         self.planar_alignment_manager = planar_alignment_manager
         self.selection_label = None
+        # Count the label currently shows
+        self._label_count = 0
         self.config = config
         # Optional PartManager for precomputed face metadata
         self.part_manager = part_manager
@@ -43,10 +48,8 @@ class SelectionManager:
 
         # Simple selection system: faces are either selected (orange) or unselected (base color)
         # Maps fingerprint to tuple of (parent_AIS_ColoredShape, original_color, Face namedtuple)
-        self.selected_faces: Dict[str, Tuple[AIS_ColoredShape, object]] = {}
-
-        # Map fingerprint to the Face namedtuple
-        self.face_by_fingerprint: Dict[str, object] = {}
+        # so recolor and restore loops need no second lookup per face
+        self.selected_faces: Dict[str, Tuple[AIS_ColoredShape, object, object]] = {}
 
         # Map part_index to selected Face for planar alignment
         self.part_selected_faces: Dict[int, object] = {}
@@ -55,6 +58,22 @@ class SelectionManager:
     def set_selection_label(self, label):
         """Set reference to the selection count label."""
         self.selection_label = label
+        self._label_count = 0
+
+    def _update_selection_label(self):
+        """Show the current selection count.
+
+        The label is set right after construction, before any event handler
+        can run, so it is not checked for None here.
+        """
+        count = len(self.selected_faces)
+        # Hiding or restoring parts often leaves the count as it was
+        if count == self._label_count:
+            return
+        self._label_count = count
+        self.selection_label.config(
+            text=f"Selected: {count} face{'s' if count != 1 else ''}"
+        )
 
     def register_part_base_color(self, ais_shape, color):
         """
@@ -71,10 +90,7 @@ class SelectionManager:
 
     def _get_selected_color(self):
         """Get the highlight color for selected faces (orange or changeable via color_manager)."""
-        color = self.color_manager.get_fill_quantity_color()
-        rgb, name = self.color_manager.get_current_fill_color()
-        logger.debug(f"Selection color: {name} RGB{rgb}")
-        return color
+        return self.color_manager.get_fill_quantity_color()
 
     def toggle_mode(self) -> bool:
         """Toggle between navigation and selection mode. Returns new mode state.
@@ -94,7 +110,9 @@ class SelectionManager:
             True if a face was selected/deselected, False otherwise
         """
         try:
-            self.display.Context.MoveTo(x, y, view, True)
+            # Pick without drawing the hover highlight; it is cleared below and
+            # the viewer is updated once at the end
+            self.display.Context.MoveTo(x, y, view, False)
 
             if not self.display.Context.HasDetected():
                 return False
@@ -126,9 +144,7 @@ class SelectionManager:
             original_color = self.ais_base_colors.get(parent_ais)
             if original_color is None:
                 logger.warning(f"No base color registered for AIS object {parent_ais}")
-                from OCC.Core.Quantity import Quantity_Color, Quantity_TOC_RGB
-
-                original_color = Quantity_Color(0.5, 0.5, 0.5, Quantity_TOC_RGB)
+                original_color = self.FALLBACK_BASE_COLOR
 
             logger.debug(f"    selection fingerprint={fingerprint}")
 
@@ -140,27 +156,19 @@ class SelectionManager:
                 action = "Deselected"
             else:
                 # Select: apply highlight color
-                self.selected_faces[fingerprint] = (parent_ais, original_color)
-                self.face_by_fingerprint[fingerprint] = face
+                self.selected_faces[fingerprint] = (parent_ais, original_color, face)
                 parent_ais.SetCustomColor(detected_shape, self._get_selected_color())
                 action = "Selected"
 
-            # Redisplay the parent object to apply the custom color immediately
-            self.display.Context.Redisplay(parent_ais, True)
+            # Recompute the parent's presentation; the viewer updates once below
+            self.display.Context.Redisplay(parent_ais, False)
             # Clear OCCT's automatic highlighting so our custom colors take precedence
             self.display.Context.ClearDetected()
             self.display.Context.UpdateCurrentViewer()
-            self.display.Repaint()
-            root.update_idletasks()
-            root.update()
-
-            total_selected = len(self.selected_faces)
-            if self.selection_label:
-                self.selection_label.config(
-                    text=f"Selected: {total_selected} face{'s' if total_selected != 1 else ''}"
-                )
 
-            logger.info(f"{action} face (total: {total_selected})")
+            self._update_selection_label()
+
+            logger.info(f"{action} face (total: {len(self.selected_faces)})")
             return True
 
         except Exception as e:
@@ -182,7 +190,7 @@ class SelectionManager:
             True if a face was detected and logged, False otherwise
         """
         try:
-            self.display.Context.MoveTo(x, y, view, True)
+            self.display.Context.MoveTo(x, y, view, False)
 
             if not self.display.Context.HasDetected():
                 return False
@@ -217,12 +225,10 @@ class SelectionManager:
                     fp = face.fingerprint
                     global_face_number = face.global_index
 
-                    # Find per-part face id (1-based) within the part's faces
+                    # Per-part face id (1-based): global indices run
+                    # consecutively within a part, so no scan of its faces
                     faces_in_part = self.part_manager.get_faces_for_part(part_idx)
-                    for i, face_in_part in enumerate(faces_in_part):
-                        if face_in_part.shape.IsEqual(detected_shape):
-                            face_id = i + 1  # 1-based
-                            break
+                    face_id = face.global_index - faces_in_part[0].global_index + 1
 
             except Exception:
                 part_idx = None
@@ -251,7 +257,6 @@ class SelectionManager:
             # Clear OCCT detection highlighting
             self.display.Context.ClearDetected()
             self.display.Context.UpdateCurrentViewer()
-            self.display.Repaint()
 
             return True
 
@@ -261,32 +266,33 @@ class SelectionManager:
 
     def clear_all(self, root):
         """Clear all selected faces by restoring original colors."""
-        # Restore original colors for all selected faces
-        for fingerprint, (parent_ais, original_color) in self.selected_faces.items():
+        # Restore original colors for all selected faces; redraw happens once below
+        redrawn_objects = set()
+        for fingerprint, (
+            parent_ais,
+            original_color,
+            face,
+        ) in self.selected_faces.items():
             try:
-                face = self.face_by_fingerprint.get(fingerprint)
                 if face is not None and parent_ais is not None:
                     parent_ais.SetCustomColor(face.shape, original_color)
-                    self.display.Context.Redisplay(parent_ais, True)
+                    if id(parent_ais) not in redrawn_objects:
+                        self.display.Context.Redisplay(parent_ais, False)
+                        redrawn_objects.add(id(parent_ais))
             except Exception as e:
                 logger.warning(f"Could not restore color for face {fingerprint}: {e}")
 
         self.selected_faces.clear()
-        self.face_by_fingerprint.clear()
         self.part_selected_faces.clear()
 
         # Clear selected faces in planar alignment manager
         if self.planar_alignment_manager:
             self.planar_alignment_manager.set_selected_faces({})
 
-        self.display.Context.ClearSelected(True)
+        self.display.Context.ClearSelected(False)
         self.display.Context.UpdateCurrentViewer()
-        self.display.Repaint()
-        root.update_idletasks()
-        root.update()
 
-        if self.selection_label:
-            self.selection_label.config(text="Selected: 0 faces")
+        self._update_selection_label()
 
         logger.info("Cleared all selections")
 
@@ -296,26 +302,36 @@ class SelectionManager:
 
         # Update all selected faces with the new color
         redrawn_objects = set()
-        for fingerprint, (parent_ais, _) in self.selected_faces.items():
+        for fingerprint, (parent_ais, _, face) in self.selected_faces.items():
             try:
-                face = self.face_by_fingerprint.get(fingerprint)
                 if face is not None and parent_ais is not None:
                     parent_ais.SetCustomColor(face.shape, fill_color)
                     # Only redisplay each object once (in case multiple faces on same object)
                     if id(parent_ais) not in redrawn_objects:
-                        self.display.Context.Redisplay(parent_ais, True)
+                        self.display.Context.Redisplay(parent_ais, False)
                         redrawn_objects.add(id(parent_ais))
             except Exception as e:
                 logger.warning(f"Could not update color for face {fingerprint}: {e}")
 
         self.display.Context.UpdateCurrentViewer()
-        self.display.Repaint()
-        root.update_idletasks()
-        root.update()
 
         fill_rgb, fill_name = self.color_manager.get_current_fill_color()
         logger.info(f"\nSelection color updated: {fill_name} RGB{fill_rgb}\n")
 
+    def update_outline_color(self, root):
+        """Update the selection outline color (when cycling through colors via '2' key)."""
+        # The outline is the context selection style's face boundary, set up in
+        # configure_display; only that aspect changes, so the filled faces are
+        # neither restyled nor redisplayed
+        outline_color = self.color_manager.get_outline_quantity_color()
+        self.display.Context.SelectionStyle().FaceBoundaryAspect().SetColor(
+            outline_color
+        )
+        self.display.Context.UpdateCurrentViewer()
+
+        outline_rgb, outline_name = self.color_manager.get_current_outline_color()
+        logger.info(f"\nOutline color updated: {outline_name} RGB{outline_rgb}\n")
+
     def get_selection_count(self) -> int:
         """Get number of currently selected faces."""
         return len(self.selected_faces)
@@ -327,13 +343,16 @@ class SelectionManager:
         """
         hidden_selections = {}
         faces_to_remove = []
+        redrawn_objects = set()
 
         # Hide selected faces that belong to hidden parts
-        for fingerprint, (parent_ais, original_color) in list(
-            self.selected_faces.items()
-        ):
+        # Deletions are deferred to after the loop, so no snapshot is needed
+        for fingerprint, (
+            parent_ais,
+            original_color,
+            face,
+        ) in self.selected_faces.items():
             if parent_ais in ais_shapes_to_hide:
-                face = self.face_by_fingerprint.get(fingerprint)
                 if face is not None:
                     hidden_selections[fingerprint] = {
                         "parent_ais": parent_ais,
@@ -342,7 +361,9 @@ class SelectionManager:
                     }
                     # Restore original color to hide the highlight
                     parent_ais.SetCustomColor(face.shape, original_color)
-                    self.display.Context.Redisplay(parent_ais, True)
+                    if id(parent_ais) not in redrawn_objects:
+                        self.display.Context.Redisplay(parent_ais, False)
+                        redrawn_objects.add(id(parent_ais))
                     faces_to_remove.append(fingerprint)
 
         # Remove from active selections
@@ -350,15 +371,9 @@ class SelectionManager:
             del self.selected_faces[fingerprint]
 
         # Update selection count label
-        count = len(self.selected_faces)
-        if self.selection_label:
-            self.selection_label.config(
-                text=f"Selected: {count} face{'s' if count != 1 else ''}"
-            )
+        self._update_selection_label()
 
         self.display.Context.UpdateCurrentViewer()
-        self.display.Repaint()
-        root.update_idletasks()
 
         return hidden_selections
 
@@ -372,26 +387,19 @@ class SelectionManager:
 
             try:
                 # Restore as selected with highlight color
-                self.selected_faces[fingerprint] = (parent_ais, original_color)
-                self.face_by_fingerprint[fingerprint] = face
+                self.selected_faces[fingerprint] = (parent_ais, original_color, face)
                 parent_ais.SetCustomColor(face.shape, self._get_selected_color())
                 # Only redisplay each object once (in case multiple faces on same object)
                 if id(parent_ais) not in redrawn_objects:
-                    self.display.Context.Redisplay(parent_ais, True)
+                    self.display.Context.Redisplay(parent_ais, False)
                     redrawn_objects.add(id(parent_ais))
             except Exception as e:
                 logger.warning(f"Could not restore selection for face {fingerprint}: {e}")
 
         # Update selection count label
-        count = len(self.selected_faces)
-        if self.selection_label:
-            self.selection_label.config(
-                text=f"Selected: {count} face{'s' if count != 1 else ''}"
-            )
+        self._update_selection_label()
 
         self.display.Context.UpdateCurrentViewer()
-        self.display.Repaint()
-        root.update_idletasks()
 
     def select_largest_external_faces(self, parts_list: List[Tuple], root):
         """
@@ -421,19 +429,6 @@ class SelectionManager:
         # Get all solids for occlusion checking (entire assembly)
         all_solids = [part.shape for part in parts_list]
 
-        
-        global_face_map = {}
-        global_idx = 1
-        for part in parts_list:
-            exp_g = TopExp_Explorer(part.shape, TopAbs_FACE)
-            while exp_g.More():
-                f = exp_g.Current()
-                key = f.__hash__() if hasattr(f, "__hash__") else id(f)
-                if key not in global_face_map:
-                    global_face_map[key] = global_idx
-                global_idx += 1
-                exp_g.Next()
-
         for idx, part in enumerate(parts_list):
             # Find all faces and their areas from the Face namedtuples
             face_areas = []
@@ -557,26 +552,22 @@ class SelectionManager:
                         logger.warning(
                             f"No base color registered for AIS object {part.ais_colored_shape}"
                         )
-                        from OCC.Core.Quantity import Quantity_Color, Quantity_TOC_RGB
-
-                        original_color = Quantity_Color(0.5, 0.5, 0.5, Quantity_TOC_RGB)
+                        original_color = self.FALLBACK_BASE_COLOR
 
                     # Apply highlight color to the selected face
                     part.ais_colored_shape.SetCustomColor(
                         selected_face.shape, self._get_selected_color()
                     )
-                    # Redisplay to apply the color (deduplicate later if needed)
-                    self.display.Context.Redisplay(part.ais_colored_shape, True)
+                    # Redisplay to apply the color; the viewer updates once below
+                    self.display.Context.Redisplay(part.ais_colored_shape, False)
 
-                    # Store the parent and original color in selected faces
+                    # Store the parent, original color and Face namedtuple
                     self.selected_faces[fingerprint] = (
                         part.ais_colored_shape,
                         original_color,
+                        selected_face,
                     )
 
-                    # Store Face namedtuple for later use
-                    self.face_by_fingerprint[fingerprint] = selected_face
-
                     # Store part's selected Face for planar alignment
                     self.part_selected_faces[idx] = selected_face
 
@@ -585,16 +576,10 @@ class SelectionManager:
         # Update display with clear detected to avoid OCCT's automatic highlighting
         self.display.Context.ClearDetected()
         self.display.Context.UpdateCurrentViewer()
-        self.display.Repaint()
-        root.update_idletasks()
-        root.update()
 
         # Update selection count label
         count = len(self.selected_faces)
-        if self.selection_label:
-            self.selection_label.config(
-                text=f"Selected: {count} face{'s' if count != 1 else ''}"
-            )
+        self._update_selection_label()
 
         # Update planar alignment manager with selected faces
         if self.planar_alignment_manager:
@@ -2,25 +2,52 @@
 Main viewer UI components.
 """
 
-from typing import List
+from typing import List, Tuple
 import tkinter as tk
 from tkinter import ttk
 from ..config import ViewerConfig
 
 
+def _linear_to_srgb(value: float) -> float:
+    """Encode a linear RGB component (Quantity_TOC_RGB) as sRGB."""
+    value = min(max(value, 0.0), 1.0)
+    if value <= 0.0031308:
+        return value * 12.92
+    return 1.055 * value ** (1.0 / 2.4) - 0.055
+
+
+def _hex_color(rgb: Tuple[float, float, float]) -> str:
+    """Tk color string for a linear RGB triple, as shown in the 3D view."""
+    r, g, b = (int(round(_linear_to_srgb(c) * 255)) for c in rgb)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
 class UIManager:
     """Manages the viewer UI components."""
 
+    # Shared tree tag for parts highlighted from the parts list
+    HIGHLIGHT_TAG = "highlighted"
+
+    # Parts tree rows inserted per Tk event loop pass
+    TREE_CHUNK_SIZE = 500
+
     def __init__(self, root: tk.Tk, config: ViewerConfig):
         self.root = root
         self.config = config
         self.parts_tree = None
+        # Tree tag per palette entry (None for hidden duplicates); tags outlive
+        # tree refreshes, so each color is configured once
+        self._color_tags = {}
+        # Pending after() id while a large tree is still being filled
+        self._tree_fill_job = None
         self.mode_label = None
         self.selection_label = None
         self.explode_slider = None
         self.explode_label = None
         self.thickness_slider = None
         self.thickness_label = None
+        self.plate_listbox = None
+        self.plate_info_label = None
 
     def setup_window(self):
         """Setup the main window."""
@@ -88,6 +115,9 @@ class UIManager:
 
         self.parts_tree = ttk.Treeview(tree_frame, style="Dark.Treeview", show="tree")
         self.parts_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.parts_tree.tag_configure(
+            self.HIGHLIGHT_TAG, foreground="#ffff00", font=("Arial", 9, "bold")
+        )
 
         scrollbar = ttk.Scrollbar(
             tree_frame, orient=tk.VERTICAL, command=self.parts_tree.yview
@@ -475,7 +505,7 @@ class UIManager:
 
     def update_plate_list(self, plate_manager):
         """Update the plate list display."""
-        if not hasattr(self, "plate_listbox"):
+        if self.plate_listbox is None:
             return
 
         # Clear current list
@@ -496,11 +526,29 @@ class UIManager:
             text=f"Plates: {total_plates} | Parts assigned: {total_assigned}"
         )
 
-    def populate_parts_tree(self, parts_list: List, deduplication_manager=None):
-        """Populate the parts tree with parts."""
+    def populate_parts_tree(
+        self, parts_list: List, deduplication_manager=None, on_complete=None
+    ):
+        """
+        Populate the parts tree with parts.
+
+        Rows are inserted TREE_CHUNK_SIZE at a time, one chunk per Tk event
+        loop pass, so huge assemblies keep the viewer responsive while the
+        tree fills.
+
+        Args:
+            parts_list: List of Part namedtuples
+            deduplication_manager: Optional manager marking hidden duplicates
+            on_complete: Optional callback run once every row is inserted
+        """
         if not self.parts_tree:
             return
 
+        # A refresh supersedes any fill still in progress
+        if self._tree_fill_job is not None:
+            self.root.after_cancel(self._tree_fill_job)
+            self._tree_fill_job = None
+
         root_node = self.parts_tree.insert(
             "",
             "end",
@@ -508,38 +556,70 @@ class UIManager:
             open=True,
         )
 
-        for i, part in enumerate(parts_list):
-            r, g, b = part.pallete
-            hex_color = f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
-
-            # Check if this part is hidden as a duplicate
-            is_hidden = deduplication_manager and deduplication_manager.is_part_hidden(
-                i
-            )
-
-            if is_hidden:
-                part_name = f"■ Part {i+1} (hidden - duplicate)"
-                # Use a dimmed color for hidden parts
-                hex_color = "#666666"
-            else:
-                part_name = f"■ Part {i+1}"
-
-            self.parts_tree.insert(
-                root_node, "end", text=part_name, tags=(f"part_{i}",)
-            )
-            # Set default styling (will be overridden by highlight indicators if needed)
-            self.parts_tree.tag_configure(
-                f"part_{i}", foreground=hex_color, font=("Arial", 9)
-            )
-
-    def update_parts_tree(self, parts_list: List, deduplication_manager=None):
+        # Resolved once for the per-row loop
+        insert = self.parts_tree.insert
+        color_tag = self.part_color_tag
+        hidden = deduplication_manager.hidden_indices if deduplication_manager else ()
+
+        def insert_chunk(start):
+            end = min(start + self.TREE_CHUNK_SIZE, len(parts_list))
+            for i in range(start, end):
+                # Check if this part is hidden as a duplicate
+                is_hidden = i in hidden
+                item = f"part_{i}"
+                part = parts_list[i]
+                # Named parts show the name from the file after their number
+                if part.name:
+                    part_name = f"■ Part {i+1}: {part.name}"
+                else:
+                    part_name = f"■ Part {i+1}"
+                if is_hidden:
+                    part_name += " (hidden - duplicate)"
+
+                # The part tag identifies the row and doubles as its iid for
+                # direct lookup; styling comes from a shared color tag
+                # (swapped for HIGHLIGHT_TAG while highlighted)
+                insert(
+                    root_node,
+                    "end",
+                    iid=item,
+                    text=part_name,
+                    tags=(item, color_tag(part.pallete, is_hidden)),
+                )
+
+            if end < len(parts_list):
+                self._tree_fill_job = self.root.after(0, insert_chunk, end)
+                return
+
+            self._tree_fill_job = None
+            if on_complete:
+                on_complete()
+
+        # The first chunk goes in right away, so typical models fill at once
+        insert_chunk(0)
+
+    def part_color_tag(self, rgb, is_hidden: bool = False) -> str:
+        """Return the shared tree tag styling a part row in its color."""
+        # Keyed by the palette entry itself, so a row costs one dict lookup;
+        # the hex string is only formatted the first time a color is seen
+        key = None if is_hidden else rgb
+        tag = self._color_tags.get(key)
+        if tag is None:
+            # Parts hidden as duplicates use a dimmed color
+            hex_color = "#666666" if is_hidden else _hex_color(rgb)
+            tag = self._color_tags[key] = f"color_{len(self._color_tags)}"
+            self.parts_tree.tag_configure(tag, foreground=hex_color, font=("Arial", 9))
+        return tag
+
+    def update_parts_tree(
+        self, parts_list: List, deduplication_manager=None, on_complete=None
+    ):
         """Update the parts tree to reflect current visibility state."""
         if not self.parts_tree:
             return
 
-        # Clear existing tree
-        for item in self.parts_tree.get_children():
-            self.parts_tree.delete(item)
+        # Clear existing tree in one Tcl call
+        self.parts_tree.delete(*self.parts_tree.get_children())
 
         # Repopulate with updated information
-        self.populate_parts_tree(parts_list, deduplication_manager)
+        self.populate_parts_tree(parts_list, deduplication_manager, on_complete)